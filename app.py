@@ -14,33 +14,67 @@ if sys.platform == 'win32':
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, render_template, jsonify, request, Response
 from flask_cors import CORS
-import threading
 import json
+import threading
 import time
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
+
 from src.data.market_data import MarketDataFetcher
 from src.data.news_scraper import NewsScraper
 from src.data.flow_scraper import FlowScraper, get_flow_data
 from src.data.ticker_fetcher import TickerFetcher
-from src.strategies.loader import get_strategy, list_strategies, STRATEGIES
-from config import SP100_TICKERS
+from src.strategies.loader import get_strategy, list_strategies, STRATEGIES, STRATEGY_INFO
+from config import SP100_TICKERS, CORS_ORIGINS, SCAN_TIMEOUT, SCAN_WORKERS, MAX_CANDIDATES, PORT, FLASK_DEBUG
+from cache import SharedCache
 
 app = Flask(__name__, template_folder='web/templates', static_folder='web/static')
 
-# CORS configuration - allow Vercel frontend
-CORS_ORIGINS_ENV = os.getenv('CORS_ORIGINS', '*')
-if CORS_ORIGINS_ENV == '*':
-    CORS_ORIGINS = '*'  # Allow all origins
-else:
-    # Split by comma and strip whitespace
-    CORS_ORIGINS = [origin.strip() for origin in CORS_ORIGINS_ENV.split(',') if origin.strip()]
-
-CORS(app, origins=CORS_ORIGINS, supports_credentials=True)
 
-# Global state for scan progress
+def json_response(payload, status: int = 200) -> Response:
+    """
+    Serialize a JSON response with orjson when available (5-10x faster than
+    jsonify for large payloads like scan results); falls back to jsonify.
+    """
+    if orjson is not None:
+        return Response(
+            orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY),
+            status=status,
+            mimetype='application/json',
+        )
+    response = jsonify(payload)
+    response.status_code = status
+    return response
+
+# CORS configuration - allow Vercel frontend (parsed once in config.py)
+CORS(app, origins=CORS_ORIGINS if CORS_ORIGINS == '*' else list(CORS_ORIGINS),
+     supports_credentials=True)
+
+# Compress large JSON payloads (scan results are mostly repeating keys,
+# so gzip typically shrinks them ~10x over the Vercel<->backend leg)
+if Compress is not None:
+    app.config['COMPRESS_MIMETYPES'] = ['application/json']
+    app.config['COMPRESS_LEVEL'] = 6
+    app.config['COMPRESS_MIN_SIZE'] = 1024
+    Compress(app)
+
+# Global state for scan progress. Mutated from both HTTP threads and the
+# background scan worker - hold _scan_lock for any compound read/write so
+# status polls never observe a half-reset state.
+_scan_lock = threading.RLock()
 scan_state = {
     'running': False,
     'progress': 0,
@@ -51,14 +85,6 @@ scan_state = {
     'started_at': None,  # Timestamp for timeout detection
 }
 
-# Simple in-memory cache for market data and scan results
-cache = {
-    'price_data': {},  # {ticker: {data, timestamp}}
-    'scan_results': {},  # {cache_key: {results, timestamp}}
-    'news': {},  # {key: {data, timestamp}}
-    'market_data': {},  # {key: {data, timestamp}}
-}
-
 # Cache TTLs (in seconds)
 CACHE_TTL = {
     'price_data': 900,  # 15 minutes
@@ -67,18 +93,37 @@ CACHE_TTL = {
     'market_data': 300,  # 5 minutes
 }
 
-# Scan timeout (5 minutes = 300 seconds)
-SCAN_TIMEOUT = int(os.getenv('SCAN_TIMEOUT', '300'))
+# Shared cache: Redis-backed when REDIS_URL/REDIS_HOST is set (so all workers
+# share one warm cache), otherwise an in-process dict with the same TTLs.
+cache = SharedCache(CACHE_TTL)
+
+# Persistent scan worker: one long-lived executor instead of spawning a new
+# thread per request. max_workers=1 also guarantees scans are serialized.
+scan_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='scan-worker')
 
-# Ticker fetcher for dynamic universe
+# Ticker fetcher for dynamic universe - warm the S&P 500 list in the
+# background so the first 'extended' scan doesn't block on Wikipedia
 ticker_fetcher = TickerFetcher()
+ticker_fetcher.warm()
+
+# Shared scraper instances - they hold pooled sessions and keyword tables,
+# so constructing them per request wastes setup work
+news_scraper = NewsScraper()
+flow_scraper = FlowScraper()
+
+# Shared fetcher for quote lookups - keeps the pooled HTTP session (and any
+# JIT-warmed indicator kernels) alive across requests
+quote_fetcher = MarketDataFetcher()
+
+# News categories that usually move options prices
+HIGH_IMPACT_CATEGORIES = frozenset({'earnings', 'fda', 'merger_acquisition', 'macro', 'guidance'})
 
 # Smaller ticker list for faster scans (quick mode)
-QUICK_TICKERS = [
+QUICK_TICKERS = (
     "AAPL", "MSFT", "GOOGL", "AMZN", "META", "NVDA", "TSLA", "AMD", "NFLX", "CRM",
     "JPM", "BAC", "GS", "V", "MA", "XOM", "CVX", "JNJ", "UNH", "PFE",
     "WMT", "HD", "MCD", "NKE", "SBUX", "KO", "PEP", "COST", "DIS", "PYPL",
-]
+)
 
 
 @app.route('/')
@@ -105,36 +150,35 @@ def tools_page():
     return render_template('tools.html')
 
 
+# Pre-serialized once at import - strategy info never changes at runtime
+_STRATEGIES_JSON = json.dumps(STRATEGY_INFO).encode()
+
+
 @app.route('/api/strategies')
 def get_strategies():
     """Get list of available strategies."""
-    strategies = []
-    for key, strategy_class in STRATEGIES.items():
-        s = strategy_class()
-        info = s.get_info()
-        info['key'] = key
-        strategies.append(info)
-    return jsonify(strategies)
+    return Response(_STRATEGIES_JSON, mimetype='application/json')
 
 
 @app.route('/api/scan/start', methods=['POST'])
 def start_scan():
     """Start a new scan."""
     global scan_state
-    
-    # Check for stuck scans (timeout failsafe)
-    if scan_state['running'] and scan_state.get('started_at'):
-        elapsed = time.time() - scan_state['started_at']
-        if elapsed > SCAN_TIMEOUT:
-            print(f"WARNING: Scan timeout detected ({elapsed:.0f}s > {SCAN_TIMEOUT}s). Resetting...")
-            scan_state['running'] = False
-            scan_state['error'] = 'Previous scan timed out. Starting new scan.'
-        else:
+
+    with _scan_lock:
+        # Check for stuck scans (timeout failsafe)
+        if scan_state['running'] and scan_state.get('started_at'):
+            elapsed = time.time() - scan_state['started_at']
+            if elapsed > SCAN_TIMEOUT:
+                print(f"WARNING: Scan timeout detected ({elapsed:.0f}s > {SCAN_TIMEOUT}s). Resetting...")
+                scan_state['running'] = False
+                scan_state['error'] = 'Previous scan timed out. Starting new scan.'
+            else:
+                return jsonify({'error': 'Scan already running'}), 400
+
+        if scan_state['running']:
             return jsonify({'error': 'Scan already running'}), 400
     
-    if scan_state['running']:
-        return jsonify({'error': 'Scan already running'}), 400
-    
     data = request.json or {}
     strategy_key = data.get('strategy', '1')
     scan_type = data.get('type', 'quick')  # 'quick', 'full', or 'extended'
@@ -146,13 +190,14 @@ def start_scan():
     
     # Check cache first
     cache_key = f"{strategy_key}_{scan_type}"
-    cached = cache['scan_results'].get(cache_key)
-    if cached and (time.time() - cached['timestamp']) < CACHE_TTL['scan_results']:
+    cached = cache.get('scan_results', cache_key)
+    if cached:
         print(f"Returning cached scan results for {cache_key}")
-        scan_state['results'] = cached['results']
-        scan_state['has_results'] = True
-        scan_state['running'] = False
-        return jsonify({'status': 'cached', 'total': len(cached['results'].get('candidates', []))})
+        with _scan_lock:
+            scan_state['results'] = cached
+            scan_state['has_results'] = True
+            scan_state['running'] = False
+        return jsonify({'status': 'cached', 'total': len(cached.get('candidates', []))})
     
     # Get tickers based on scan type
     if scan_type == 'quick':
@@ -172,7 +217,7 @@ def start_scan():
         return jsonify({'error': 'No tickers available for scanning'}), 400
     
     # Reset state with timestamp
-    scan_state = {
+    new_state = {
         'running': True,
         'progress': 0,
         'current_ticker': '',
@@ -184,11 +229,11 @@ def start_scan():
         'strategy_info': strategy.get_info(),
         'started_at': time.time(),  # Track when scan started
     }
-    
-    # Run scan in background thread
-    thread = threading.Thread(target=run_scan, args=(strategy, tickers, strategy_key, cache_key))
-    thread.daemon = True
-    thread.start()
+    with _scan_lock:
+        scan_state = new_state
+
+    # Queue scan on the persistent background worker
+    scan_executor.submit(run_scan, strategy, tickers, strategy_key, cache_key)
     
     return jsonify({'status': 'started', 'total': len(tickers)})
 
@@ -198,11 +243,12 @@ def run_scan(strategy, tickers, strategy_key, cache_key):
     global scan_state, cache
     
     # Initialize state
-    scan_state['running'] = True
-    scan_state['error'] = None
-    scan_state['has_results'] = False
-    scan_state['results'] = None
-    scan_state['started_at'] = time.time()
+    with _scan_lock:
+        scan_state['running'] = True
+        scan_state['error'] = None
+        scan_state['has_results'] = False
+        scan_state['results'] = None
+        scan_state['started_at'] = time.time()
     
     try:
         # Timeout check at start
@@ -230,44 +276,56 @@ def run_scan(strategy, tickers, strategy_key, cache_key):
             scan_state['has_results'] = False
             return
         
-        # Apply strategy filters
-        results = []
-        for ticker, data in market_data.items():
-            # Check timeout periodically
-            if scan_state.get('started_at') and (time.time() - scan_state['started_at']) > SCAN_TIMEOUT:
-                raise TimeoutError(f'Scan exceeded timeout of {SCAN_TIMEOUT}s')
-            
-            try:
-                result = strategy.check_entry(ticker, data)
-                
-                # Convert to dict for JSON
-                result_dict = {
-                    'ticker': result.ticker,
-                    'passed': result.passed,
-                    'direction': result.direction,
-                    'signal_strength': result.signal_strength,
-                    'reasons': result.reasons,
-                    'trade_type': result.trade_type,
-                    'price': data.get('price'),
-                    'return_5d': data.get('return_5d'),
-                    'return_20d': data.get('return_20d'),
-                    'iv_rank': data.get('iv_rank'),
-                    'rsi': data.get('rsi'),
-                    'ma20': data.get('ma20'),
-                    'ma50': data.get('ma50'),
-                }
-                results.append(result_dict)
-            except Exception as e:
-                # Skip individual ticker errors
-                continue
-        
-        # Sort by passed + signal strength
-        results.sort(key=lambda x: (x['passed'], x['signal_strength']), reverse=True)
-        
+        # Apply strategy filters in parallel (check_entry can touch options data)
+        remaining = SCAN_TIMEOUT - (time.time() - scan_state['started_at'])
+        if remaining <= 0:
+            raise TimeoutError(f'Scan exceeded timeout of {SCAN_TIMEOUT}s')
+
+        # Keep results as lightweight tuples; full dicts are only built for
+        # the top slice the UI actually renders
+        light = []
+        with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+            futures = {
+                executor.submit(strategy.check_entry, ticker, data): (ticker, data)
+                for ticker, data in market_data.items()
+            }
+            for future in as_completed(futures, timeout=remaining):
+                ticker, data = futures[future]
+                try:
+                    result = future.result()
+                    light.append((bool(result.passed), result.signal_strength, result, data))
+                except Exception as e:
+                    # Skip individual ticker errors
+                    continue
+
+        # Sort the tuples, then materialize dicts only for the survivors
+        light.sort(key=itemgetter(0, 1), reverse=True)
+        passed_count = sum(1 for entry in light if entry[0])
+        total_count = len(light)
+
+        results = [
+            {
+                'ticker': result.ticker,
+                'passed': result.passed,
+                'direction': result.direction,
+                'signal_strength': result.signal_strength,
+                'reasons': result.reasons,
+                'trade_type': result.trade_type,
+                'price': data.get('price'),
+                'return_5d': data.get('return_5d'),
+                'return_20d': data.get('return_20d'),
+                'iv_rank': data.get('iv_rank'),
+                'rsi': data.get('rsi'),
+                'ma20': data.get('ma20'),
+                'ma50': data.get('ma50'),
+            }
+            for passed, strength, result, data in light[:MAX_CANDIDATES]
+        ]
+
         scan_results = {
             'candidates': results,
-            'passed_count': len([r for r in results if r['passed']]),
-            'total_count': len(results),
+            'passed_count': passed_count,
+            'total_count': total_count,
             'timestamp': datetime.now().isoformat(),
             'strategy': strategy.get_info(),
             'structure': strategy.get_option_structure(),
@@ -275,67 +333,101 @@ def run_scan(strategy, tickers, strategy_key, cache_key):
         }
         
         # Cache results
-        cache['scan_results'][cache_key] = {
-            'results': scan_results,
-            'timestamp': time.time()
-        }
-        
-        scan_state['results'] = scan_results
-        scan_state['has_results'] = True
-        scan_state['error'] = None
+        cache.set('scan_results', cache_key, scan_results)
         
+        with _scan_lock:
+            scan_state['results'] = scan_results
+            scan_state['has_results'] = True
+            scan_state['error'] = None
+
     except TimeoutError as e:
         print(f"Scan timeout: {e}")
-        scan_state['error'] = str(e)
-        scan_state['has_results'] = False
+        with _scan_lock:
+            scan_state['error'] = str(e)
+            scan_state['has_results'] = False
     except Exception as e:
         import traceback
         error_msg = f"{str(e)}\n{traceback.format_exc()}"
         print(f"Scan error: {error_msg}")
-        scan_state['error'] = str(e)
-        scan_state['has_results'] = False
+        with _scan_lock:
+            scan_state['error'] = str(e)
+            scan_state['has_results'] = False
     finally:
         # Always reset running state, even on error
-        scan_state['running'] = False
-        scan_state['started_at'] = None
+        with _scan_lock:
+            scan_state['running'] = False
+            scan_state['started_at'] = None
 
 
 @app.route('/api/scan/reset', methods=['POST'])
 def reset_scan():
     """Reset scan state (force clear if stuck)."""
     global scan_state
-    scan_state = {
-        'running': False,
-        'progress': 0,
-        'current_ticker': '',
-        'total': 0,
-        'results': None,
-        'error': None,
-        'has_results': False,
-        'started_at': None,
-    }
+    with _scan_lock:
+        scan_state = {
+            'running': False,
+            'progress': 0,
+            'current_ticker': '',
+            'total': 0,
+            'results': None,
+            'error': None,
+            'has_results': False,
+            'started_at': None,
+        }
     return jsonify({'status': 'reset'})
 
 
+def _scan_status_snapshot() -> dict:
+    """Build the current scan status dict under the lock (with timeout failsafe)."""
+    with _scan_lock:
+        if scan_state.get('running') and scan_state.get('started_at'):
+            elapsed = time.time() - scan_state['started_at']
+            if elapsed > SCAN_TIMEOUT:
+                scan_state['running'] = False
+                scan_state['error'] = f'Scan timed out after {SCAN_TIMEOUT}s'
+                scan_state['started_at'] = None
+
+        return {
+            'running': scan_state.get('running', False),
+            'progress': scan_state.get('progress', 0),
+            'total': scan_state.get('total', 0),
+            'current_ticker': scan_state.get('current_ticker', ''),
+            'error': scan_state.get('error'),
+            'has_results': scan_state.get('has_results', False) or scan_state.get('results') is not None,
+        }
+
+
 @app.route('/api/scan/status')
 def scan_status():
     """Get current scan status."""
-    # Check for timeout
-    if scan_state.get('running') and scan_state.get('started_at'):
-        elapsed = time.time() - scan_state['started_at']
-        if elapsed > SCAN_TIMEOUT:
-            scan_state['running'] = False
-            scan_state['error'] = f'Scan timed out after {SCAN_TIMEOUT}s'
-            scan_state['started_at'] = None
-    
-    return jsonify({
-        'running': scan_state.get('running', False),
-        'progress': scan_state.get('progress', 0),
-        'total': scan_state.get('total', 0),
-        'current_ticker': scan_state.get('current_ticker', ''),
-        'error': scan_state.get('error'),
-        'has_results': scan_state.get('has_results', False) or scan_state.get('results') is not None,
-    })
+    return jsonify(_scan_status_snapshot())
+
+
+@app.route('/api/scan/stream')
+def scan_stream():
+    """
+    Stream scan progress as Server-Sent Events.
+    One persistent connection instead of the client polling /api/scan/status.
+    """
+    def generate():
+        last = None
+        while True:
+            status = _scan_status_snapshot()
+            if status != last:
+                yield f"data: {json.dumps(status)}\n\n"
+                last = status
+            if not status['running']:
+                break
+            time.sleep(0.25)
+
+    return Response(
+        generate(),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no',  # Disable proxy buffering
+        },
+    )
 
 
 @app.route('/api/scan/results')
@@ -343,45 +435,52 @@ def scan_results():
     """Get scan results."""
     if scan_state['results'] is None:
         return jsonify({'error': 'No results available'}), 404
-    return jsonify(scan_state['results'])
+    return json_response(scan_state['results'])
 
 
 @app.route('/api/news/<ticker>')
 def get_news(ticker):
     """Get news for a specific ticker."""
-    scraper = NewsScraper()
-    news = scraper.get_ticker_news(ticker, max_articles=5)
-    return jsonify(news)
+    cached = cache.get('news', f'ticker_{ticker.upper()}')
+    if cached is not None:
+        return json_response(cached)
+
+    news = news_scraper.get_ticker_news(ticker, max_articles=5)
+    cache.set('news', f'ticker_{ticker.upper()}', news)
+    return json_response(news)
 
 
 @app.route('/api/news/market')
 def get_market_news():
     """Get stock-specific news with sentiment for options trading."""
-    scraper = NewsScraper()
-    
+    cached = cache.get('news', 'market')
+    if cached is not None:
+        return json_response(cached)
+
     # Get stock-specific news with sentiment analysis
-    stock_news = scraper.get_stock_news_with_sentiment(max_per_ticker=2)
-    
+    stock_news = news_scraper.get_stock_news_with_sentiment(max_per_ticker=2)
+
     # Also get general market news
-    market_news = scraper.get_market_news(max_articles=5)
+    market_news = news_scraper.get_market_news(max_articles=5)
     
     # Combine and deduplicate
     all_news = []
     seen_titles = set()
     
     for item in stock_news + market_news:
-        title_key = item['title'].lower()[:50]
+        # str.hash is SipHash - dedup on 8-byte ints instead of keeping
+        # a lowercased copy of every title prefix around
+        title_key = hash(item['title'][:50].casefold())
         if title_key not in seen_titles:
             seen_titles.add(title_key)
             
             # Add categories
-            item['categories'] = scraper.categorize_news(item)
+            item['categories'] = news_scraper.categorize_news(item)
             
             # Add impact based on sentiment strength and categories
-            high_impact_cats = ['earnings', 'fda', 'merger_acquisition', 'macro', 'guidance']
             sentiment = item.get('sentiment', {})
-            
-            if sentiment.get('strength') == 'strong' or any(cat in high_impact_cats for cat in item['categories']):
+
+            if sentiment.get('strength') == 'strong' or not HIGH_IMPACT_CATEGORIES.isdisjoint(item['categories']):
                 item['impact'] = 'high'
             else:
                 item['impact'] = 'normal'
@@ -397,21 +496,28 @@ def get_market_news():
         reverse=True
     )
     
-    return jsonify({
+    payload = {
         'news': all_news[:30],  # Top 30 articles
         'timestamp': datetime.now().isoformat(),
-    })
+    }
+    cache.set('news', 'market', payload)
+    return json_response(payload)
 
 
 @app.route('/api/flow')
 def get_flow():
     """Get unusual options flow and whale activity only."""
+    cached = cache.get('market_data', 'flow')
+    if cached is not None:
+        return json_response(cached)
+
     try:
-        scraper = FlowScraper()
-        return jsonify({
-            'unusual_flow': scraper.get_unusual_flow(),
+        payload = {
+            'unusual_flow': flow_scraper.get_unusual_flow(),
             'timestamp': datetime.now().isoformat(),
-        })
+        }
+        cache.set('market_data', 'flow', payload)
+        return json_response(payload)
     except Exception as e:
         return jsonify({
             'error': str(e),
@@ -423,17 +529,22 @@ def get_flow():
 @app.route('/api/market')
 def get_market():
     """Get market data: indices, sentiment, sectors, events, movers."""
+    cached = cache.get('market_data', 'market')
+    if cached is not None:
+        return json_response(cached)
+
     try:
-        scraper = FlowScraper()
-        return jsonify({
-            'sentiment': scraper.get_fear_greed_index(),
-            'indices': scraper.get_market_indices(),
-            'sectors': scraper.get_sector_performance(),
-            'events': scraper.get_upcoming_events(),
-            'movers': scraper.get_market_movers(),
-            'most_active': scraper.get_most_active_options(),
+        payload = {
+            'sentiment': flow_scraper.get_fear_greed_index(),
+            'indices': flow_scraper.get_market_indices(),
+            'sectors': flow_scraper.get_sector_performance(),
+            'events': flow_scraper.get_upcoming_events(),
+            'movers': flow_scraper.get_market_movers(),
+            'most_active': flow_scraper.get_most_active_options(),
             'timestamp': datetime.now().isoformat(),
-        })
+        }
+        cache.set('market_data', 'market', payload)
+        return json_response(payload)
     except Exception as e:
         return jsonify({
             'error': str(e),
@@ -453,8 +564,7 @@ def get_earnings():
     filter_type = request.args.get('filter', 'this-week')
     
     try:
-        scraper = FlowScraper()
-        earnings = scraper.get_earnings_calendar(filter_type)
+        earnings = flow_scraper.get_earnings_calendar(filter_type)
         return jsonify({
             'earnings': earnings,
             'filter': filter_type,
@@ -472,18 +582,24 @@ def get_earnings():
 @app.route('/api/quote/<ticker>')
 def get_quote(ticker):
     """Get quick quote for a ticker."""
+    cached = cache.get('price_data', ticker.upper())
+    if cached is not None:
+        return jsonify(cached)
+
     try:
-        fetcher = MarketDataFetcher([ticker.upper()])
-        data = fetcher.get_ticker_data(ticker.upper())
-        
+        data = quote_fetcher.get_ticker_data(ticker.upper())
+
         if data:
-            return jsonify({
+            payload = {
                 'ticker': ticker.upper(),
                 'price': data.get('price'),
-                'change_pct': data.get('return_1d', 0) * 100 if data.get('return_1d') else None,
+                # return_1d is already percent-scaled (and None when unknown)
+                'change_pct': data.get('return_1d'),
                 'iv_rank': data.get('iv_rank'),
                 'timestamp': datetime.now().isoformat(),
-            })
+            }
+            cache.set('price_data', ticker.upper(), payload)
+            return jsonify(payload)
         else:
             return jsonify({'error': 'Could not fetch data'}), 404
     except Exception as e:
@@ -496,11 +612,10 @@ if __name__ == '__main__':
     os.makedirs('web/static/css', exist_ok=True)
     os.makedirs('web/static/js', exist_ok=True)
     
-    # Get port from environment (Railway sets PORT)
-    port = int(os.getenv('PORT', 5000))
-    # Enable debug mode by default for local development (unless explicitly disabled)
-    debug = os.getenv('FLASK_DEBUG', 'True').lower() == 'true'
-    
+    # Port (Railway sets PORT) and debug mode come from config.py constants
+    port = PORT
+    debug = FLASK_DEBUG
+
     print("\n" + "=" * 50)
     print("  OPTIONS EDGE SCANNER")
     print(f"  Running on port {port}")
@@ -0,0 +1,97 @@
+"""
+Shared Cache Backend
+Redis-backed cache with per-key TTLs so multiple workers share one warm cache.
+Falls back to an in-process dict when Redis is not configured/available.
+"""
+import os
+import pickle
+import time
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+
+class SharedCache:
+    """
+    TTL cache keyed by (section, key).
+    Sections map to TTLs (e.g. 'scan_results' -> 300s) so callers don't
+    have to repeat timeout logic at every call site.
+    """
+
+    def __init__(self, ttls: dict):
+        self.ttls = ttls
+        self._local = {}  # {(section, key): {'value': ..., 'timestamp': ...}}
+        self._redis = self._connect_redis()
+
+    def _connect_redis(self):
+        """Connect to Redis if configured (REDIS_URL or REDIS_HOST), else None."""
+        if redis is None:
+            return None
+
+        redis_url = os.getenv('REDIS_URL', '')
+        redis_host = os.getenv('REDIS_HOST', '')
+        if not redis_url and not redis_host:
+            return None
+
+        try:
+            if redis_url:
+                client = redis.Redis.from_url(redis_url, decode_responses=False)
+            else:
+                client = redis.Redis(
+                    host=redis_host,
+                    port=int(os.getenv('REDIS_PORT', '6379')),
+                    decode_responses=False,
+                )
+            client.ping()
+            print("Cache: using shared Redis backend")
+            return client
+        except Exception as e:
+            print(f"Cache: Redis unavailable ({e}), falling back to in-process cache")
+            return None
+
+    def _ttl(self, section: str) -> int:
+        return int(self.ttls.get(section, 300))
+
+    def get(self, section: str, key: str):
+        """Return cached value or None if missing/expired."""
+        if self._redis is not None:
+            try:
+                raw = self._redis.get(f"{section}:{key}")
+                return pickle.loads(raw) if raw is not None else None
+            except Exception:
+                return None
+
+        entry = self._local.get((section, key))
+        if entry and (time.time() - entry['timestamp']) < self._ttl(section):
+            return entry['value']
+        return None
+
+    def set(self, section: str, key: str, value):
+        """Store value with the section's TTL."""
+        if self._redis is not None:
+            try:
+                self._redis.setex(f"{section}:{key}", self._ttl(section), pickle.dumps(value))
+                return
+            except Exception:
+                pass  # Fall through to local cache on Redis errors
+
+        self._local[(section, key)] = {'value': value, 'timestamp': time.time()}
+
+    def clear(self, section: str = None):
+        """Clear one section (or everything) - mainly for tests/debugging."""
+        if self._redis is not None:
+            try:
+                pattern = f"{section}:*" if section else "*"
+                keys = self._redis.keys(pattern)
+                if keys:
+                    self._redis.delete(*keys)
+                return
+            except Exception:
+                pass
+
+        if section is None:
+            self._local.clear()
+        else:
+            self._local = {k: v for k, v in self._local.items() if k[0] != section}
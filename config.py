@@ -16,10 +16,26 @@ NEWS_API_KEY = os.getenv("NEWS_API_KEY", "")
 ALPHA_VANTAGE_KEY = os.getenv("ALPHA_VANTAGE_KEY", "")
 POLYGON_API_KEY = os.getenv("POLYGON_API_KEY", "")
 
+# =============================================================================
+# SERVER SETTINGS (parsed once at import - no per-request os.getenv)
+# =============================================================================
+PORT = int(os.getenv("PORT", "5000"))
+FLASK_DEBUG = os.getenv("FLASK_DEBUG", "True").lower() == "true"
+SCAN_TIMEOUT = int(os.getenv("SCAN_TIMEOUT", "300"))  # seconds
+SCAN_WORKERS = int(os.getenv("SCAN_WORKERS", "16"))
+MAX_CANDIDATES = int(os.getenv("MAX_CANDIDATES", "200"))  # top-K results kept per scan
+
+# CORS: '*' or comma-separated list of allowed origins
+_cors_env = os.getenv("CORS_ORIGINS", "*")
+if _cors_env == "*":
+    CORS_ORIGINS = "*"
+else:
+    CORS_ORIGINS = tuple(origin.strip() for origin in _cors_env.split(",") if origin.strip())
+
 # =============================================================================
 # UNIVERSE - S&P 100 Tickers (OEX)
 # =============================================================================
-SP100_TICKERS = [
+SP100_TICKERS = (
     "AAPL", "ABBV", "ABT", "ACN", "ADBE", "AIG", "AMD", "AMGN", "AMT", "AMZN",
     "AVGO", "AXP", "BA", "BAC", "BK", "BKNG", "BLK", "BMY", "BRK-B", "C",
     "CAT", "CHTR", "CL", "CMCSA", "COF", "COP", "COST", "CRM", "CSCO", "CVS",
@@ -30,10 +46,13 @@ SP100_TICKERS = [
     "NEE", "NFLX", "NKE", "NVDA", "ORCL", "PEP", "PFE", "PG", "PM", "PYPL",
     "QCOM", "RTX", "SBUX", "SCHW", "SO", "SPG", "T", "TGT", "TMO", "TMUS",
     "TXN", "UNH", "UNP", "UPS", "USB", "V", "VZ", "WBA", "WFC", "WMT", "XOM"
-]
+)
+
+# O(1) membership checks
+SP100_SET = frozenset(SP100_TICKERS)
 
 # Tickers to exclude (too volatile/meme-like)
-EXCLUDED_TICKERS = ["GME", "AMC", "BBBY", "RIVN", "LCID"]
+EXCLUDED_TICKERS = frozenset({"GME", "AMC", "BBBY", "RIVN", "LCID"})
 
 # =============================================================================
 # EDGE #1: TREND-FOLLOWING DEBIT SPREAD FILTERS
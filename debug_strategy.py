@@ -18,19 +18,18 @@ print("=" * 70)
 print("STRATEGY DEBUG TEST")
 print("=" * 70)
 
+# Fetch data once - it's strategy-independent, so no need to refetch per loop
+fetcher = MarketDataFetcher(test_tickers)
+market_data = fetcher.scan_all(fetch_options=True)
+print(f"\nFetched data for {len(market_data)} tickers")
+
 # Test each strategy
 for strategy_num in ['1', '2', '3', '4', '5']:
     strategy = get_strategy(strategy_num)
     print(f"\n{'='*70}")
     print(f"Testing Strategy {strategy_num}: {strategy.NAME}")
     print(f"{'='*70}")
-    
-    # Fetch data
-    fetcher = MarketDataFetcher(test_tickers)
-    market_data = fetcher.scan_all(fetch_options=True)
-    
-    print(f"\nFetched data for {len(market_data)} tickers")
-    
+
     # Test each ticker
     passed = []
     failed = []
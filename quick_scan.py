@@ -9,6 +9,8 @@ Run: python quick_scan.py
 import sys
 import os
 import argparse
+import heapq
+import time
 
 # Fix Windows console encoding
 if sys.platform == 'win32':
@@ -21,9 +23,10 @@ from datetime import datetime
 from src.data.market_data import MarketDataFetcher
 from src.strategies.loader import get_strategy, print_strategy_menu, STRATEGIES, STRATEGY_NAMES
 from src.strategies.base import StrategyResult
+from scanner import check_entries
 
 # Quick scan - diverse set of liquid stocks
-QUICK_TICKERS = [
+QUICK_TICKERS = (
     # Tech
     "AAPL", "MSFT", "GOOGL", "AMZN", "META", "NVDA", "TSLA", "AMD", "NFLX", "CRM",
     # Finance
@@ -32,7 +35,7 @@ QUICK_TICKERS = [
     "XOM", "CVX", "JNJ", "UNH", "PFE",
     # Consumer
     "WMT", "HD", "MCD", "NKE", "SBUX",
-]
+)
 
 
 def parse_args():
@@ -86,37 +89,45 @@ def main():
     fetcher = MarketDataFetcher(QUICK_TICKERS)
     
     print("Fetching market data...")
+
+    last_update = [0.0]
+
+    def update_progress(t, i, n):
+        # Throttle terminal writes to <=10 Hz now that fetches run in parallel
+        now = time.monotonic()
+        if now - last_update[0] < 0.1 and i < n:
+            return
+        last_update[0] = now
+        print(f"  [{i}/{n}] {t}        ", end="\r")
+
     # All strategies need options data to evaluate properly
-    market_data = fetcher.scan_all(
-        progress_callback=lambda t, i, n: print(f"  [{i}/{n}] {t}        ", end="\r"),
-        fetch_options=True
-    )
+    market_data = fetcher.scan_all(progress_callback=update_progress, fetch_options=True)
     print(f"\n[OK] Got data for {len(market_data)} tickers\n")
     
-    # Apply strategy
+    # Apply strategy (parallel for larger universes, sequential for small)
     print(f"Applying {strategy.NAME} filters...")
-    results = []
-    for ticker, data in market_data.items():
-        result = strategy.check_entry(ticker, data)
-        results.append(result)
-    
-    results.sort(key=lambda x: (x.passed, x.signal_strength), reverse=True)
-    passed = [r for r in results if r.passed]
-    
-    print(f"[OK] {len(passed)}/{len(results)} passed\n")
-    
+    results = check_entries(strategy, market_data)
+
+    # Top-k selection: O(N log k) nlargest instead of sorting everything
+    passed_count = sum(1 for r in results if r.passed)
+    passed = heapq.nlargest(
+        10, (r for r in results if r.passed), key=lambda x: x.signal_strength
+    )
+
+    print(f"[OK] {passed_count}/{len(results)} passed\n")
+
     # Display results
     if passed:
         print("-" * 60)
         print(f"{'Ticker':<8} {'Direction':<10} {'Type':<15} {'Strength':>10}")
         print("-" * 60)
-        
-        for r in passed[:10]:
+
+        for r in passed:
             d = market_data.get(r.ticker, {})
             print(f"{r.ticker:<8} {r.direction or 'NEUTRAL':<10} {r.trade_type:<15} {r.signal_strength:>9.0f}%")
-        
+
         print("-" * 60)
-        
+
         # Top candidate details
         top = passed[0]
         data = market_data.get(top.ticker, {})
@@ -136,14 +147,19 @@ def main():
         print("    Try a different strategy or wait for better setups.")
         
         # Show near misses
-        near = [r for r in results if r.signal_strength >= 25][:3]
+        near = heapq.nlargest(
+            3, (r for r in results if r.signal_strength >= 25),
+            key=lambda x: x.signal_strength
+        )
         if near:
             print("\n    Near misses:")
             for r in near:
                 print(f"      {r.ticker}: {r.reasons[0] if r.reasons else '?'}")
     
-    # Sample failures
-    failed = [r for r in results if not r.passed][:5]
+    # Sample failures (strongest non-passing first, same as the old sort gave)
+    failed = heapq.nlargest(
+        5, (r for r in results if not r.passed), key=lambda x: x.signal_strength
+    )
     if failed:
         print("\n--- Sample failures ---")
         for r in failed:
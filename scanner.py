@@ -13,7 +13,11 @@ if sys.platform == 'win32':
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
+import time
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 
 from src.data.market_data import MarketDataFetcher
 from src.data.news_scraper import NewsScraper
@@ -49,7 +53,22 @@ def select_strategy() -> BaseStrategy:
         print(f"Invalid choice: {choice}. Please enter 1-5.")
 
 
-def scan_with_strategy(strategy: BaseStrategy, tickers: list[str]) -> tuple[dict, list[StrategyResult]]:
+def check_entries(strategy: BaseStrategy, market_data: dict, max_workers: int = 8) -> list[StrategyResult]:
+    """
+    Run strategy.check_entry for every ticker, in parallel for larger
+    universes. Threads (not processes) so the options DataFrames in each
+    ticker's data dict aren't pickled per call; small scans stay sequential.
+    """
+    items = list(market_data.items())
+
+    if len(items) < 20:
+        return [strategy.check_entry(ticker, data) for ticker, data in items]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda item: strategy.check_entry(*item), items))
+
+
+def scan_with_strategy(strategy: BaseStrategy, tickers: list[str]) -> tuple[dict, list[StrategyResult], list[StrategyResult]]:
     """
     Scan tickers using the selected strategy.
     """
@@ -57,8 +76,16 @@ def scan_with_strategy(strategy: BaseStrategy, tickers: list[str]) -> tuple[dict
     print("    (This may take 5-10 minutes for full S&P 100)\n")
     
     fetcher = MarketDataFetcher(tickers)
-    
+
+    last_update = [0.0]
+
     def update_progress(ticker, current, total):
+        # Coalesce terminal writes to <=10 Hz - parallel fetches can fire
+        # this callback far faster than the terminal can redraw
+        now = time.monotonic()
+        if now - last_update[0] < 0.1 and current < total:
+            return
+        last_update[0] = now
         pct = current / total * 100
         bar = "#" * int(pct / 5) + "-" * (20 - int(pct / 5))
         print(f"  [{bar}] {current}/{total} {ticker}        ", end="\r")
@@ -82,19 +109,16 @@ def scan_with_strategy(strategy: BaseStrategy, tickers: list[str]) -> tuple[dict
                 print(f"  {key}: {value}")
         print()
     
-    results = []
+    results = check_entries(strategy, market_data)
+
     failure_reasons = {}  # Track why stocks fail
-    
-    for ticker, data in market_data.items():
-        result = strategy.check_entry(ticker, data)
-        results.append(result)
-        
+    for result in results:
         # Track failure reasons
         if not result.passed:
             primary_reason = result.reasons[0] if result.reasons else "Unknown"
             if primary_reason not in failure_reasons:
                 failure_reasons[primary_reason] = []
-            failure_reasons[primary_reason].append(ticker)
+            failure_reasons[primary_reason].append(result.ticker)
     
     # Show failure summary
     if not any(r.passed for r in results):
@@ -108,20 +132,26 @@ def scan_with_strategy(strategy: BaseStrategy, tickers: list[str]) -> tuple[dict
                 print(f"      Examples: {', '.join(tickers)}")
         print()
     
-    # Sort by signal strength
-    results.sort(key=lambda x: (x.passed, x.signal_strength), reverse=True)
-    
-    passed = [r for r in results if r.passed]
+    # Sort by (passed, signal strength) - C-level lexsort over parallel
+    # arrays instead of Python tuple compares per element
+    strengths = np.fromiter((r.signal_strength for r in results), dtype=np.float32, count=len(results))
+    passed_mask = np.fromiter((r.passed for r in results), dtype=bool, count=len(results))
+    order = np.lexsort((strengths, passed_mask))[::-1]
+    results = [results[i] for i in order]
+
+    # Partition once - every display stage reuses these two lists
+    passed, failed = [], []
+    for r in results:
+        (passed if r.passed else failed).append(r)
+
     print(f"[OK] {len(passed)} tickers passed all filters\n")
-    
-    return market_data, results
 
+    return market_data, passed, failed
 
-def display_results(results: list[StrategyResult], market_data: dict, strategy: BaseStrategy):
-    """Display scan results."""
-    passed = [r for r in results if r.passed]
-    failed = [r for r in results if not r.passed]
-    
+
+def display_results(passed: list[StrategyResult], failed: list[StrategyResult],
+                    market_data: dict, strategy: BaseStrategy):
+    """Display scan results (passed/failed already partitioned by caller)."""
     # Summary
     print("-" * 70)
     print(f"{'SCAN SUMMARY':^70}")
@@ -129,7 +159,7 @@ def display_results(results: list[StrategyResult], market_data: dict, strategy:
     print(f"  Strategy: {strategy.NAME}")
     print(f"  Edge Type: {strategy.EDGE_TYPE.upper()}")
     print(f"  Expected Win Rate: {strategy.EXPECTED_WIN_RATE * 100:.0f}%")
-    print(f"  Passed: {len(passed)} / {len(results)}")
+    print(f"  Passed: {len(passed)} / {len(passed) + len(failed)}")
     print("-" * 70)
     
     if not passed:
@@ -201,13 +231,13 @@ def display_results(results: list[StrategyResult], market_data: dict, strategy:
         print(f"    Stop Loss: {exits.get('stop_loss_pct', 0.5)*100:.0f}% of entry")
 
 
-def display_failed_sample(results: list[StrategyResult], limit: int = 8):
+def display_failed_sample(failed: list[StrategyResult], limit: int = 8):
     """Show sample of why tickers failed."""
-    failed = [r for r in results if not r.passed][:limit]
-    
+    failed = failed[:limit]
+
     if not failed:
         return
-    
+
     print(f"\n--- Sample Failures (showing {len(failed)}) ---")
     for r in failed:
         reason = r.reasons[0] if r.reasons else 'Unknown'
@@ -217,20 +247,24 @@ def display_failed_sample(results: list[StrategyResult], limit: int = 8):
         print(f"  {r.ticker}: {reason}")
 
 
-def fetch_news_for_results(results: list[StrategyResult]):
-    """Fetch news for top results."""
-    passed = [r for r in results if r.passed][:3]
-    
+def fetch_news_for_results(passed: list[StrategyResult]):
+    """Fetch news for top passing results."""
+    passed = passed[:3]
+
     if not passed:
         return
     
     print("\n[*] Fetching news for top candidates...")
-    
+
     scraper = NewsScraper()
-    
-    for result in passed:
-        news = scraper.get_ticker_news(result.ticker, max_articles=2)
-        
+
+    # RSS fetches are I/O-bound - fan out the candidates in parallel
+    with ThreadPoolExecutor(max_workers=len(passed)) as executor:
+        news_lists = list(executor.map(
+            lambda r: scraper.get_ticker_news(r.ticker, max_articles=2), passed
+        ))
+
+    for result, news in zip(passed, news_lists):
         if news:
             print(f"\n  {result.ticker} News:")
             for item in news:
@@ -255,16 +289,16 @@ def main():
     
     try:
         # Scan
-        market_data, results = scan_with_strategy(strategy, SP100_TICKERS)
-        
+        market_data, passed, failed = scan_with_strategy(strategy, SP100_TICKERS)
+
         # Display results
-        display_results(results, market_data, strategy)
-        
+        display_results(passed, failed, market_data, strategy)
+
         # Show sample failures
-        display_failed_sample(results)
-        
+        display_failed_sample(failed)
+
         # Fetch news
-        fetch_news_for_results(results)
+        fetch_news_for_results(passed)
         
         print("\n" + "=" * 70)
         print("SCAN COMPLETE")
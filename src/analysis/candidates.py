@@ -5,11 +5,101 @@ Outputs exact strikes, prices, and risk parameters.
 """
 from dataclasses import dataclass
 from typing import Optional
-import pandas as pd
 import numpy as np
+import pandas as pd
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    njit = None
+    NUMBA_AVAILABLE = False
+
+
+def _delta_call_loop(strikes: np.ndarray, current_price: float, time_factor: float) -> np.ndarray:
+    """Piecewise call-delta proxy, one pass per chain (Numba-friendly)."""
+    out = np.empty(strikes.shape[0])
+    for i in range(strikes.shape[0]):
+        m = strikes[i] / current_price
+        if m <= 0.95:       # Deep ITM
+            out[i] = 0.85 + 0.15 * time_factor
+        elif m <= 1.0:      # Slightly ITM
+            out[i] = 0.55 + 0.15 * (1 - m) / 0.05
+        elif m <= 1.05:     # ATM to slightly OTM
+            out[i] = 0.50 - 0.20 * (m - 1) / 0.05
+        elif m <= 1.10:     # OTM
+            out[i] = 0.30 - 0.15 * (m - 1.05) / 0.05
+        else:               # Deep OTM
+            v = 0.15 - 0.10 * (m - 1.10) / 0.10
+            out[i] = v if v > 0.05 else 0.05
+    return out
+
+
+def _delta_put_loop(strikes: np.ndarray, current_price: float, time_factor: float) -> np.ndarray:
+    """Piecewise put-delta proxy, one pass per chain (Numba-friendly)."""
+    out = np.empty(strikes.shape[0])
+    for i in range(strikes.shape[0]):
+        m = strikes[i] / current_price
+        if m >= 1.05:       # Deep ITM
+            out[i] = -0.85 - 0.15 * time_factor
+        elif m >= 1.0:      # Slightly ITM
+            out[i] = -0.55 - 0.15 * (m - 1) / 0.05
+        elif m >= 0.95:     # ATM to slightly OTM
+            out[i] = -0.50 + 0.20 * (1 - m) / 0.05
+        elif m >= 0.90:     # OTM
+            out[i] = -0.30 + 0.15 * (0.95 - m) / 0.05
+        else:               # Deep OTM
+            v = -0.15 + 0.10 * (0.90 - m) / 0.10
+            out[i] = v if v > -0.15 else -0.15
+    return out
+
+
+def _delta_call_ramps(moneyness: np.ndarray, time_factor) -> np.ndarray:
+    """
+    Branchless form of the call-delta proxy: the piecewise-linear curve
+    rebuilt as a sum of clipped ramps (one clip per segment, plus the
+    step at m=1.0), identical to the branchy version to the last bit.
+    One np.where handles the deep-ITM plateau; everything else is plain
+    SIMD-friendly arithmetic with no per-branch masked writes.
+    """
+    m = moneyness
+    d = (0.05
+         + np.clip(1.20 - m, 0.0, 0.10)
+         + 3.0 * np.clip(1.10 - m, 0.0, 0.05)
+         + 4.0 * np.clip(1.05 - m, 0.0, 0.05)
+         + 0.05 * (m <= 1.0)
+         + 3.0 * np.clip(1.0 - m, 0.0, 0.05))
+    return np.where(m <= 0.95, 0.85 + 0.15 * time_factor, d)
+
+
+def _delta_put_ramps(moneyness: np.ndarray, time_factor) -> np.ndarray:
+    """Branchless put-delta proxy (mirror of _delta_call_ramps)."""
+    m = moneyness
+    d = (-0.15
+         + np.maximum(0.90 - m, 0.0)
+         - 3.0 * np.clip(m - 0.90, 0.0, 0.05)
+         - 4.0 * np.clip(m - 0.95, 0.0, 0.05)
+         - 0.05 * (m >= 1.0)
+         - 3.0 * np.clip(m - 1.0, 0.0, 0.05))
+    return np.where(m >= 1.05, -0.85 - 0.15 * time_factor, d)
+
+
+if NUMBA_AVAILABLE:
+    _delta_call_kernel = njit(cache=True, fastmath=True)(_delta_call_loop)
+    _delta_put_kernel = njit(cache=True, fastmath=True)(_delta_put_loop)
 
+    # Warm up the JIT at import so the first scan doesn't pay compile time
+    _warm_strikes = np.linspace(90.0, 110.0, 8)
+    _delta_call_kernel(_warm_strikes, 100.0, 1.0)
+    _delta_put_kernel(_warm_strikes, 100.0, 1.0)
+else:
+    # Without Numba the scalar loops are slow - _estimate_delta_vec keeps
+    # its np.select path as the vectorized fallback
+    _delta_call_kernel = None
+    _delta_put_kernel = None
 
-@dataclass
+
+@dataclass(slots=True)
 class SpreadCandidate:
     """A specific debit spread trade candidate."""
     ticker: str
@@ -67,6 +157,109 @@ class SpreadCandidate:
             'short_delta': round(self.short_delta, 2),
         }
 
+    @staticmethod
+    def batch_to_dicts(candidates: list['SpreadCandidate']) -> list[dict]:
+        """
+        Export many candidates at once. Builds a single DataFrame and
+        rounds the numeric columns in one vectorized pass instead of nine
+        Python round() calls per instance - same keys as to_dict, use this
+        for large result sets.
+        """
+        if not candidates:
+            return []
+
+        cols = ['ticker', 'direction', 'type', 'expiration', 'dte',
+                'current_price', 'long_strike', 'short_strike', 'spread_width',
+                'mid_debit', 'max_debit', 'max_profit', 'max_loss',
+                'breakeven', 'risk_reward', 'long_delta', 'short_delta']
+        df = pd.DataFrame(
+            [(c.ticker, c.direction, c.spread_type, c.expiration, c.dte,
+              c.current_price, c.long_strike, c.short_strike, c.spread_width,
+              c.mid_debit, c.max_debit, c.max_profit, c.max_loss,
+              c.breakeven, c.risk_reward, c.long_delta, c.short_delta)
+             for c in candidates],
+            columns=cols,
+        )
+        round_cols = cols[cols.index('mid_debit'):]
+        df[round_cols] = df[round_cols].round(2)
+        return df.to_dict('records')
+
+
+def precompute_chain_stats(options_data: dict, key: str) -> Optional[dict]:
+    """
+    One fused pass over a chain ('calls' or 'puts'): extract strike/bid/ask/
+    openInterest/volume as ndarrays and compute mid, spread_pct and the
+    quotable mask together, instead of each consumer re-scanning the frame.
+    The result is stashed on options_data so generators and liquidity
+    checks share it.
+    """
+    stats = options_data.get(f'{key}_stats')
+    if stats is not None:
+        return stats
+
+    chain = options_data.get(key)
+    if chain is None or chain.empty:
+        return None
+
+    strike = chain['strike'].to_numpy(dtype=np.float64)
+    bid = chain['bid'].to_numpy(dtype=np.float64)
+    ask = chain['ask'].to_numpy(dtype=np.float64)
+    if 'openInterest' in chain.columns:
+        oi = np.nan_to_num(chain['openInterest'].to_numpy(dtype=np.float64))
+    else:
+        oi = np.zeros(strike.shape[0])
+    if 'volume' in chain.columns:
+        volume = np.nan_to_num(chain['volume'].to_numpy(dtype=np.float64))
+    else:
+        volume = np.zeros(strike.shape[0])
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mid = 0.5 * (bid + ask)
+        # Sanitize once here (unquotable rows -> 100% spread) so downstream
+        # consumers stay branchless - no per-ticker NaN guards
+        spread_pct = np.nan_to_num(np.where(mid > 0, (ask - bid) / mid, np.nan), nan=1.0)
+
+    stats = {
+        'strike': strike,
+        'bid': bid,
+        'ask': ask,
+        'mid': mid,
+        'spread_pct': spread_pct,
+        'oi': oi,
+        'volume': volume,
+        'valid_mask': (bid > 0) & (ask > 0),
+    }
+    options_data[f'{key}_stats'] = stats
+    return stats
+
+
+def _batch_estimate_deltas(jobs: list, option_type: str) -> None:
+    """
+    Ragged-to-flat delta batch: concatenate every chain's strike array into
+    one flat buffer, run the piecewise estimate once over it, then scatter
+    the slices back into each chain's delta cache (the entries
+    _cached_delta consults), so per-ticker generation skips the math.
+
+    jobs: list of (options_data, cache_key, strikes, current_price, dte).
+    """
+    if not jobs:
+        return
+
+    counts = np.array([job[2].shape[0] for job in jobs])
+    strikes = np.concatenate([job[2] for job in jobs])
+    cp = np.repeat(np.array([job[3] for job in jobs], dtype=np.float64), counts)
+    tf = np.repeat(np.array([min(job[4] / 45, 1.0) for job in jobs]), counts)
+
+    moneyness = strikes / cp
+    if option_type == 'call':
+        deltas = _delta_call_ramps(moneyness, tf)
+    else:
+        deltas = _delta_put_ramps(moneyness, tf)
+
+    offsets = np.concatenate(([0], np.cumsum(counts)))
+    for (options_data, key, _strikes, price, _dte), a, b in zip(jobs, offsets[:-1], offsets[1:]):
+        options_data[key] = (price, deltas[a:b])
+
 
 class CandidateGenerator:
     """
@@ -122,109 +315,161 @@ class CandidateGenerator:
             else:  # Deep OTM
                 return max(-0.15, -0.15 + (0.10 * (0.90 - moneyness) / 0.10))
     
-    def generate_call_spread(self, ticker: str, options_data: dict, 
+    def _estimate_delta_vec(self, strikes: np.ndarray, current_price: float,
+                            option_type: str, dte: int) -> np.ndarray:
+        """
+        Vectorized _estimate_delta over a whole strike column. Dispatches to
+        the single-pass Numba kernels when available; otherwise falls back
+        to the branchless clipped-ramp form.
+        """
+        time_factor = min(dte / 45, 1.0)
+
+        if NUMBA_AVAILABLE:
+            strikes = np.ascontiguousarray(strikes, dtype=np.float64)
+            if option_type == 'call':
+                return _delta_call_kernel(strikes, current_price, time_factor)
+            return _delta_put_kernel(strikes, current_price, time_factor)
+
+        moneyness = strikes / current_price
+        if option_type == 'call':
+            return _delta_call_ramps(moneyness, time_factor)
+        return _delta_put_ramps(moneyness, time_factor)
+
+    def _cached_delta(self, options_data: dict, key: str, strikes: np.ndarray,
+                      current_price: float, option_type: str, dte: int) -> np.ndarray:
+        """
+        Memoize the estimated-delta array on the options dict so intraday
+        rescans over the same chain skip the piecewise math. Invalidated
+        when the quote moves >0.1% or the strike set changes.
+        """
+        cached = options_data.get(key)
+        if cached is not None:
+            cached_price, deltas = cached
+            if (abs(cached_price - current_price) <= 0.001 * current_price
+                    and deltas.shape[0] == strikes.shape[0]):
+                return deltas
+
+        deltas = self._estimate_delta_vec(strikes, current_price, option_type, dte)
+        options_data[key] = (current_price, deltas)
+        return deltas
+
+    def _select_best_pair(self, strike: np.ndarray, bid: np.ndarray, ask: np.ndarray,
+                          sp: np.ndarray, short_dist: np.ndarray, long_idx: np.ndarray,
+                          put: bool) -> Optional[tuple]:
+        """
+        Score every long/short combination via broadcasting and return
+        (long_index, short_index, width, max_debit, mid_debit, risk_reward,
+        avg_spread_pct) for the best valid pair, or None.
+        """
+        L_strike = strike[long_idx]
+        L_bid = bid[long_idx]
+        L_ask = ask[long_idx]
+        S_strike = strike
+        S_bid = bid
+        S_ask = ask
+
+        # (n_long, n_short) matrices for every metric
+        if put:
+            width = L_strike[:, None] - S_strike[None, :]
+        else:
+            width = S_strike[None, :] - L_strike[:, None]
+        max_debit = L_ask[:, None] - S_bid[None, :]
+        mid_debit = 0.5 * (L_ask + L_bid)[:, None] - 0.5 * (S_ask + S_bid)[None, :]
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            valid_mask = (
+                (width > 0)
+                & (max_debit > 0)
+                & (max_debit / width <= self.MAX_DEBIT_PCT)
+                & (short_dist[None, :] <= self.DELTA_TOLERANCE * 1.5)
+            )
+            risk_reward = np.where(
+                mid_debit > 0,
+                (width - mid_debit) / np.where(mid_debit > 0, mid_debit, 1.0),
+                0.0,
+            )
+            # Per-leg spread pct is precomputed once per chain; averaging
+            # two lookups beats redoing the divisions per pair
+            avg_spread_pct = 0.5 * (sp[long_idx][:, None] + sp[None, :])
+            score = np.where(valid_mask, risk_reward - avg_spread_pct * 5, -np.inf)
+
+        if score.size == 0 or not np.isfinite(score).any():
+            return None
+
+        i, j = np.unravel_index(int(score.argmax()), score.shape)
+        return (int(long_idx[i]), int(j), width[i, j], max_debit[i, j],
+                mid_debit[i, j], risk_reward[i, j], avg_spread_pct[i, j])
+
+    def generate_call_spread(self, ticker: str, options_data: dict,
                               current_price: float) -> Optional[SpreadCandidate]:
         """
         Generate a bullish call debit spread.
         Buy lower strike call, sell higher strike call.
         """
-        calls = options_data.get('calls')
-        if calls is None or calls.empty:
+        stats = precompute_chain_stats(options_data, 'calls')
+        if stats is None:
             return None
-        
+
         expiration = options_data.get('expiration')
         dte = options_data.get('dte', 30)
-        
-        # Filter to valid options (has bid/ask)
-        valid = calls[(calls['bid'] > 0) & (calls['ask'] > 0)].copy()
-        if len(valid) < 2:
+
+        # Filter to valid options (has bid/ask) - shared precomputed arrays
+        mask = stats['valid_mask']
+        strike = stats['strike'][mask]
+        bid = stats['bid'][mask]
+        ask = stats['ask'][mask]
+        oi = stats['oi'][mask]
+        if strike.shape[0] < 2:
             return None
-        
-        # Calculate estimated deltas
-        valid['est_delta'] = valid['strike'].apply(
-            lambda s: self._estimate_delta(s, current_price, 'call', dte)
-        )
-        
+
+        # Per-leg quote spread, computed once (ask > 0 under the mask)
+        sp = (ask - bid) / ask
+
+        # Calculate estimated deltas (memoized on the chain between rescans)
+        est_delta = self._cached_delta(options_data, 'est_delta_calls',
+                                       strike, current_price, 'call', dte)
+
         # Find long leg (target ~0.35 delta)
-        valid['long_dist'] = abs(valid['est_delta'] - self.LONG_DELTA_TARGET)
-        long_candidates = valid[valid['long_dist'] <= self.DELTA_TOLERANCE]
-        
-        if long_candidates.empty:
+        long_dist = np.abs(est_delta - self.LONG_DELTA_TARGET)
+        long_idx = np.nonzero(long_dist <= self.DELTA_TOLERANCE)[0]
+        if long_idx.size == 0:
             # Fallback: get closest
-            long_candidates = valid.nsmallest(3, 'long_dist')
-        
+            long_idx = np.argsort(long_dist)[:3]
+
         # Find short leg (target ~0.175 delta, must be higher strike)
-        valid['short_dist'] = abs(valid['est_delta'] - self.SHORT_DELTA_TARGET)
-        
-        best_spread = None
-        best_score = -999
-        
-        for _, long_row in long_candidates.iterrows():
-            # Short leg must be higher strike
-            short_candidates = valid[
-                (valid['strike'] > long_row['strike']) &
-                (valid['short_dist'] <= self.DELTA_TOLERANCE * 1.5)
-            ]
-            
-            if short_candidates.empty:
-                continue
-            
-            for _, short_row in short_candidates.iterrows():
-                # Calculate spread metrics
-                spread_width = short_row['strike'] - long_row['strike']
-                max_debit = long_row['ask'] - short_row['bid']
-                mid_debit = ((long_row['ask'] + long_row['bid']) / 2 - 
-                            (short_row['ask'] + short_row['bid']) / 2)
-                
-                if spread_width <= 0 or max_debit <= 0:
-                    continue
-                
-                # Check debit constraint
-                debit_pct = max_debit / spread_width
-                if debit_pct > self.MAX_DEBIT_PCT:
-                    continue
-                
-                max_profit = spread_width - mid_debit
-                risk_reward = max_profit / mid_debit if mid_debit > 0 else 0
-                
-                # Score: prefer better risk/reward and tighter spreads
-                avg_spread_pct = (
-                    (long_row['ask'] - long_row['bid']) / long_row['ask'] +
-                    (short_row['ask'] - short_row['bid']) / short_row['ask']
-                ) / 2
-                
-                score = risk_reward - (avg_spread_pct * 5)
-                
-                if score > best_score:
-                    best_score = score
-                    best_spread = SpreadCandidate(
-                        ticker=ticker,
-                        direction='BULLISH',
-                        spread_type='CALL_DEBIT',
-                        long_strike=long_row['strike'],
-                        long_bid=long_row['bid'],
-                        long_ask=long_row['ask'],
-                        long_delta=long_row['est_delta'],
-                        short_strike=short_row['strike'],
-                        short_bid=short_row['bid'],
-                        short_ask=short_row['ask'],
-                        short_delta=short_row['est_delta'],
-                        expiration=expiration,
-                        dte=dte,
-                        current_price=current_price,
-                        spread_width=spread_width,
-                        max_debit=max_debit,
-                        mid_debit=mid_debit,
-                        max_profit=max_profit,
-                        max_loss=mid_debit,
-                        breakeven=long_row['strike'] + mid_debit,
-                        risk_reward=risk_reward,
-                        spread_pct=avg_spread_pct,
-                        open_interest=int(long_row.get('openInterest', 0) + 
-                                         short_row.get('openInterest', 0)),
-                    )
-        
-        return best_spread
+        short_dist = np.abs(est_delta - self.SHORT_DELTA_TARGET)
+
+        best = self._select_best_pair(strike, bid, ask, sp, short_dist, long_idx, put=False)
+        if best is None:
+            return None
+
+        i, j, spread_width, max_debit, mid_debit, risk_reward, avg_spread_pct = best
+
+        return SpreadCandidate(
+            ticker=ticker,
+            direction='BULLISH',
+            spread_type='CALL_DEBIT',
+            long_strike=float(strike[i]),
+            long_bid=float(bid[i]),
+            long_ask=float(ask[i]),
+            long_delta=float(est_delta[i]),
+            short_strike=float(strike[j]),
+            short_bid=float(bid[j]),
+            short_ask=float(ask[j]),
+            short_delta=float(est_delta[j]),
+            expiration=expiration,
+            dte=dte,
+            current_price=current_price,
+            spread_width=spread_width,
+            max_debit=max_debit,
+            mid_debit=mid_debit,
+            max_profit=spread_width - mid_debit,
+            max_loss=mid_debit,
+            breakeven=float(strike[i]) + mid_debit,
+            risk_reward=risk_reward,
+            spread_pct=avg_spread_pct,
+            open_interest=int(oi[i] + oi[j]),
+        )
     
     def generate_put_spread(self, ticker: str, options_data: dict,
                             current_price: float) -> Optional[SpreadCandidate]:
@@ -232,97 +477,68 @@ class CandidateGenerator:
         Generate a bearish put debit spread.
         Buy higher strike put, sell lower strike put.
         """
-        puts = options_data.get('puts')
-        if puts is None or puts.empty:
+        stats = precompute_chain_stats(options_data, 'puts')
+        if stats is None:
             return None
-        
+
         expiration = options_data.get('expiration')
         dte = options_data.get('dte', 30)
-        
-        # Filter to valid options
-        valid = puts[(puts['bid'] > 0) & (puts['ask'] > 0)].copy()
-        if len(valid) < 2:
+
+        # Filter to valid options - shared precomputed arrays
+        mask = stats['valid_mask']
+        strike = stats['strike'][mask]
+        bid = stats['bid'][mask]
+        ask = stats['ask'][mask]
+        oi = stats['oi'][mask]
+        if strike.shape[0] < 2:
             return None
-        
-        # Calculate estimated deltas (negative for puts)
-        valid['est_delta'] = valid['strike'].apply(
-            lambda s: self._estimate_delta(s, current_price, 'put', dte)
-        )
-        
+
+        # Per-leg quote spread, computed once (ask > 0 under the mask)
+        sp = (ask - bid) / ask
+
+        # Calculate estimated deltas (negative for puts, memoized on the chain)
+        est_delta = self._cached_delta(options_data, 'est_delta_puts',
+                                       strike, current_price, 'put', dte)
+
         # For puts, we want |delta| close to targets
-        valid['long_dist'] = abs(abs(valid['est_delta']) - self.LONG_DELTA_TARGET)
-        valid['short_dist'] = abs(abs(valid['est_delta']) - self.SHORT_DELTA_TARGET)
-        
-        long_candidates = valid[valid['long_dist'] <= self.DELTA_TOLERANCE]
-        if long_candidates.empty:
-            long_candidates = valid.nsmallest(3, 'long_dist')
-        
-        best_spread = None
-        best_score = -999
-        
-        for _, long_row in long_candidates.iterrows():
-            # Short leg must be lower strike for put spread
-            short_candidates = valid[
-                (valid['strike'] < long_row['strike']) &
-                (valid['short_dist'] <= self.DELTA_TOLERANCE * 1.5)
-            ]
-            
-            if short_candidates.empty:
-                continue
-            
-            for _, short_row in short_candidates.iterrows():
-                spread_width = long_row['strike'] - short_row['strike']
-                max_debit = long_row['ask'] - short_row['bid']
-                mid_debit = ((long_row['ask'] + long_row['bid']) / 2 -
-                            (short_row['ask'] + short_row['bid']) / 2)
-                
-                if spread_width <= 0 or max_debit <= 0:
-                    continue
-                
-                debit_pct = max_debit / spread_width
-                if debit_pct > self.MAX_DEBIT_PCT:
-                    continue
-                
-                max_profit = spread_width - mid_debit
-                risk_reward = max_profit / mid_debit if mid_debit > 0 else 0
-                
-                avg_spread_pct = (
-                    (long_row['ask'] - long_row['bid']) / long_row['ask'] +
-                    (short_row['ask'] - short_row['bid']) / short_row['ask']
-                ) / 2
-                
-                score = risk_reward - (avg_spread_pct * 5)
-                
-                if score > best_score:
-                    best_score = score
-                    best_spread = SpreadCandidate(
-                        ticker=ticker,
-                        direction='BEARISH',
-                        spread_type='PUT_DEBIT',
-                        long_strike=long_row['strike'],
-                        long_bid=long_row['bid'],
-                        long_ask=long_row['ask'],
-                        long_delta=long_row['est_delta'],
-                        short_strike=short_row['strike'],
-                        short_bid=short_row['bid'],
-                        short_ask=short_row['ask'],
-                        short_delta=short_row['est_delta'],
-                        expiration=expiration,
-                        dte=dte,
-                        current_price=current_price,
-                        spread_width=spread_width,
-                        max_debit=max_debit,
-                        mid_debit=mid_debit,
-                        max_profit=max_profit,
-                        max_loss=mid_debit,
-                        breakeven=long_row['strike'] - mid_debit,
-                        risk_reward=risk_reward,
-                        spread_pct=avg_spread_pct,
-                        open_interest=int(long_row.get('openInterest', 0) +
-                                         short_row.get('openInterest', 0)),
-                    )
-        
-        return best_spread
+        long_dist = np.abs(np.abs(est_delta) - self.LONG_DELTA_TARGET)
+        short_dist = np.abs(np.abs(est_delta) - self.SHORT_DELTA_TARGET)
+
+        long_idx = np.nonzero(long_dist <= self.DELTA_TOLERANCE)[0]
+        if long_idx.size == 0:
+            long_idx = np.argsort(long_dist)[:3]
+
+        best = self._select_best_pair(strike, bid, ask, sp, short_dist, long_idx, put=True)
+        if best is None:
+            return None
+
+        i, j, spread_width, max_debit, mid_debit, risk_reward, avg_spread_pct = best
+
+        return SpreadCandidate(
+            ticker=ticker,
+            direction='BEARISH',
+            spread_type='PUT_DEBIT',
+            long_strike=float(strike[i]),
+            long_bid=float(bid[i]),
+            long_ask=float(ask[i]),
+            long_delta=float(est_delta[i]),
+            short_strike=float(strike[j]),
+            short_bid=float(bid[j]),
+            short_ask=float(ask[j]),
+            short_delta=float(est_delta[j]),
+            expiration=expiration,
+            dte=dte,
+            current_price=current_price,
+            spread_width=spread_width,
+            max_debit=max_debit,
+            mid_debit=mid_debit,
+            max_profit=spread_width - mid_debit,
+            max_loss=mid_debit,
+            breakeven=float(strike[i]) - mid_debit,
+            risk_reward=risk_reward,
+            spread_pct=avg_spread_pct,
+            open_interest=int(oi[i] + oi[j]),
+        )
     
     def generate_candidates(self, ticker: str, direction: str, 
                            options_data: dict) -> list[SpreadCandidate]:
@@ -356,22 +572,53 @@ def generate_all_candidates(filter_results: list, market_data: dict) -> list[Spr
     """
     generator = CandidateGenerator()
     all_candidates = []
-    
+
+    # Pre-pass: batch the delta estimation for every passing ticker in one
+    # flat NumPy call instead of re-entering the piecewise math per chain
+    call_jobs, put_jobs = [], []
     for result in filter_results:
         if not result.passed:
             continue
-        
+        options_data = market_data.get(result.ticker, {}).get('options')
+        if not options_data:
+            continue
+        current_price = options_data.get('current_price', 0)
+        if current_price <= 0:
+            continue
+        dte = options_data.get('dte', 30)
+        if result.direction == 'BULLISH':
+            stats = precompute_chain_stats(options_data, 'calls')
+            if stats is not None:
+                call_jobs.append((options_data, 'est_delta_calls',
+                                  stats['strike'][stats['valid_mask']], current_price, dte))
+        elif result.direction == 'BEARISH':
+            stats = precompute_chain_stats(options_data, 'puts')
+            if stats is not None:
+                put_jobs.append((options_data, 'est_delta_puts',
+                                 stats['strike'][stats['valid_mask']], current_price, dte))
+
+    _batch_estimate_deltas(call_jobs, 'call')
+    _batch_estimate_deltas(put_jobs, 'put')
+
+    for result in filter_results:
+        if not result.passed:
+            continue
+
         ticker = result.ticker
         direction = result.direction
         options_data = market_data.get(ticker, {}).get('options')
-        
+
         if options_data:
             candidates = generator.generate_candidates(ticker, direction, options_data)
             all_candidates.extend(candidates)
     
-    # Sort by risk/reward ratio
-    all_candidates.sort(key=lambda x: x.risk_reward, reverse=True)
-    
+    # Sort by risk/reward ratio - argsort over a flat array instead of
+    # per-item attribute lookups in a Python key function
+    if len(all_candidates) > 1:
+        rr = np.fromiter((c.risk_reward for c in all_candidates),
+                         dtype=np.float64, count=len(all_candidates))
+        all_candidates = [all_candidates[i] for i in np.argsort(rr)[::-1]]
+
     return all_candidates
 
 
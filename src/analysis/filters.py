@@ -3,14 +3,27 @@ Edge Detection Filters
 Implements the trend-following debit spread edge filters.
 These are the NON-NEGOTIABLE rules that determine valid trade candidates.
 """
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
-import pandas as pd
 import numpy as np
 
+from .candidates import precompute_chain_stats
 
-@dataclass
+
+@lru_cache(maxsize=2048)
+def _parse_earnings_date(date_str: str) -> Optional[datetime]:
+    """Parse a YYYY-MM-DD earnings date, memoized - the same strings recur
+    across tickers and rescans, so strptime runs once per distinct date."""
+    try:
+        return datetime.strptime(date_str, '%Y-%m-%d')
+    except (ValueError, TypeError):
+        return None
+
+
+@dataclass(slots=True)
 class FilterResult:
     """Result of applying filters to a ticker."""
     ticker: str
@@ -53,47 +66,82 @@ class EdgeFilters:
     def __init__(self):
         pass
     
-    def check_trend(self, data: dict) -> tuple[bool, str, list[str]]:
+    def check_trend_batch(self, market_data: dict) -> dict:
+        """
+        Vectorized trend pre-screen over the whole universe. One pass of
+        NumPy comparisons replaces the per-ticker scalar checks in
+        check_trend. Returns {ticker: 'BULLISH' | 'BEARISH' | None};
+        tickers with missing price/MA data are left out entirely.
+        """
+        tickers = []
+        rows = []
+        for ticker, data in market_data.items():
+            vals = (data.get('price'), data.get('ma20'),
+                    data.get('ma50'), data.get('return_20d'))
+            if any(v is None for v in vals):
+                continue
+            tickers.append(ticker)
+            rows.append(vals)
+
+        if not tickers:
+            return {}
+
+        price, ma20, ma50, return_20d = np.array(rows, dtype=np.float64).T
+        min_ret = self.TREND['min_return_pct'] * 100  # return_20d is in %
+
+        bull = (price > ma20) & (ma20 > ma50) & (return_20d >= min_ret)
+        bear = (price < ma20) & (ma20 < ma50) & (return_20d <= -min_ret)
+
+        directions = {}
+        for i, ticker in enumerate(tickers):
+            directions[ticker] = 'BULLISH' if bull[i] else ('BEARISH' if bear[i] else None)
+        return directions
+
+    def check_trend(self, data: dict, direction: Optional[str] = None) -> tuple[bool, str, list[str]]:
         """
         Check if stock is in a valid trend.
         Returns (passed, direction, reasons).
-        
+
         Rules:
         - Price above/below 20-day MA
-        - 20-day MA above/below 50-day MA  
+        - 20-day MA above/below 50-day MA
         - 20-day return >= 3% (bullish) or <= -3% (bearish)
+
+        When check_trend_batch already classified this ticker, pass its
+        direction to skip the scalar comparisons and only build reasons.
         """
         reasons = []
-        
+
         price = data.get('price')
         ma20 = data.get('ma20')
         ma50 = data.get('ma50')
         return_20d = data.get('return_20d')
-        
+
         # Check for missing data
         if any(v is None for v in [price, ma20, ma50, return_20d]):
             return False, None, ['Missing price/MA data']
-        
-        # Check bullish trend
-        bullish_checks = [
-            price > ma20,
-            ma20 > ma50,
-            return_20d >= self.TREND['min_return_pct'] * 100,  # return_20d is in %
-        ]
-        
-        # Check bearish trend
-        bearish_checks = [
-            price < ma20,
-            ma20 < ma50,
-            return_20d <= -self.TREND['min_return_pct'] * 100,
-        ]
-        
-        if all(bullish_checks):
+
+        if direction is not None:
+            bullish = direction == 'BULLISH'
+            bearish = direction == 'BEARISH'
+        else:
+            bullish = all([
+                price > ma20,
+                ma20 > ma50,
+                return_20d >= self.TREND['min_return_pct'] * 100,  # return_20d is in %
+            ])
+            bearish = all([
+                price < ma20,
+                ma20 < ma50,
+                return_20d <= -self.TREND['min_return_pct'] * 100,
+            ])
+
+        if bullish:
             reasons.append(f"BULLISH: Price ${price} > MA20 ${ma20} > MA50 ${ma50}")
             reasons.append(f"20D return: +{return_20d:.1f}%")
             return True, 'BULLISH', reasons
-        
-        if all(bearish_checks):
+
+        if bearish:
             reasons.append(f"BEARISH: Price ${price} < MA20 ${ma20} < MA50 ${ma50}")
             reasons.append(f"20D return: {return_20d:.1f}%")
             return True, 'BEARISH', reasons
@@ -130,36 +178,41 @@ class EdgeFilters:
         reasons.append(f"IV Rank: {iv_rank:.0f} (acceptable range)")
         return True, reasons
     
-    def check_events(self, data: dict) -> tuple[bool, list[str]]:
+    def check_events(self, data: dict, now: Optional[datetime] = None) -> tuple[bool, list[str]]:
         """
         Check for upcoming events that could cause binary moves.
-        
+
         Rules:
         - No earnings within 10 days
+
+        now: pass the scan's single datetime.now() to avoid a clock read
+        per ticker.
         """
         reasons = []
         earnings_date = data.get('earnings_date')
-        
+
         if earnings_date is None:
             reasons.append("Earnings: Unknown date")
             return True, reasons  # Allow if unknown
-        
-        try:
-            earnings_dt = datetime.strptime(earnings_date, '%Y-%m-%d')
-            days_to_earnings = (earnings_dt - datetime.now()).days
-            
-            if 0 <= days_to_earnings <= self.EVENTS['min_days_to_earnings']:
-                reasons.append(f"Earnings in {days_to_earnings} days - SKIP")
-                return False, reasons
-            
-            if days_to_earnings > 0:
-                reasons.append(f"Earnings in {days_to_earnings} days (OK)")
-            else:
-                reasons.append(f"Earnings passed {-days_to_earnings} days ago")
-                
-        except:
+
+        earnings_dt = _parse_earnings_date(earnings_date)
+        if earnings_dt is None:
             reasons.append("Earnings: Could not parse date")
-        
+            return True, reasons
+
+        if now is None:
+            now = datetime.now()
+        days_to_earnings = (earnings_dt - now).days
+
+        if 0 <= days_to_earnings <= self.EVENTS['min_days_to_earnings']:
+            reasons.append(f"Earnings in {days_to_earnings} days - SKIP")
+            return False, reasons
+
+        if days_to_earnings > 0:
+            reasons.append(f"Earnings in {days_to_earnings} days (OK)")
+        else:
+            reasons.append(f"Earnings passed {-days_to_earnings} days ago")
+
         return True, reasons
     
     def check_liquidity(self, data: dict) -> tuple[bool, list[str]]:
@@ -178,49 +231,37 @@ class EdgeFilters:
             reasons.append("No options data available")
             return False, reasons
         
-        calls = options.get('calls')
-        puts = options.get('puts')
-        
-        if calls is None or puts is None or calls.empty or puts.empty:
+        # Shared one-pass stats (mask/mid/spread already computed, cached on
+        # the options dict so the candidate generator reuses them)
+        call_stats = precompute_chain_stats(options, 'calls')
+        put_stats = precompute_chain_stats(options, 'puts')
+
+        if call_stats is None or put_stats is None:
             reasons.append("Empty options chain")
             return False, reasons
-        
+
         # Check ATM options (closest to current price)
         current_price = options.get('current_price', 0)
-        
-        # Find ATM call
-        calls_sorted = calls.copy()
-        calls_sorted['dist'] = abs(calls_sorted['strike'] - current_price)
-        atm_call = calls_sorted.nsmallest(1, 'dist').iloc[0] if not calls_sorted.empty else None
-        
-        # Find ATM put
-        puts_sorted = puts.copy()
-        puts_sorted['dist'] = abs(puts_sorted['strike'] - current_price)
-        atm_put = puts_sorted.nsmallest(1, 'dist').iloc[0] if not puts_sorted.empty else None
-        
-        if atm_call is None or atm_put is None:
-            reasons.append("Could not find ATM options")
-            return False, reasons
-        
-        # Check spread percentage
-        avg_spread_pct = (atm_call.get('spread_pct', 1) + atm_put.get('spread_pct', 1)) / 2
-        if pd.isna(avg_spread_pct):
-            avg_spread_pct = 1
-            
+
+        # Find ATM rows - a single argmin pass, no sort or frame copy
+        atm_call_idx = int(np.abs(call_stats['strike'] - current_price).argmin())
+        atm_put_idx = int(np.abs(put_stats['strike'] - current_price).argmin())
+
+        # Check spread percentage (NaN-free since the stats pass sanitizes)
+        avg_spread_pct = (call_stats['spread_pct'][atm_call_idx] + put_stats['spread_pct'][atm_put_idx]) / 2
+
         if avg_spread_pct > self.LIQUIDITY['max_spread_pct']:
             reasons.append(f"Spread {avg_spread_pct*100:.1f}% > {self.LIQUIDITY['max_spread_pct']*100}% (too wide)")
             return False, reasons
-        
+
         # Check open interest
-        avg_oi = (atm_call.get('openInterest', 0) + atm_put.get('openInterest', 0)) / 2
+        avg_oi = (call_stats['oi'][atm_call_idx] + put_stats['oi'][atm_put_idx]) / 2
         if avg_oi < self.LIQUIDITY['min_open_interest']:
             reasons.append(f"Open Interest {avg_oi:.0f} < {self.LIQUIDITY['min_open_interest']}")
             return False, reasons
-        
-        # Check volume
-        avg_vol = (atm_call.get('volume', 0) + atm_put.get('volume', 0)) / 2
-        if pd.isna(avg_vol):
-            avg_vol = 0
+
+        # Check volume (already NaN-cleaned in the stats pass)
+        avg_vol = (call_stats['volume'][atm_call_idx] + put_stats['volume'][atm_put_idx]) / 2
         if avg_vol < self.LIQUIDITY['min_daily_volume']:
             reasons.append(f"Volume {avg_vol:.0f} < {self.LIQUIDITY['min_daily_volume']} (low liquidity)")
             # This is a soft filter - warn but don't reject
@@ -229,15 +270,19 @@ class EdgeFilters:
         reasons.append(f"Liquidity OK: Spread {avg_spread_pct*100:.1f}%, OI {avg_oi:.0f}")
         return True, reasons
     
-    def apply_all_filters(self, ticker: str, data: dict) -> FilterResult:
+    def apply_all_filters(self, ticker: str, data: dict,
+                          trend_direction: Optional[str] = None,
+                          now: Optional[datetime] = None) -> FilterResult:
         """
         Apply all filters to a ticker and return result.
+        trend_direction: optional pre-screened direction from check_trend_batch.
+        now: optional shared timestamp for the event filter.
         """
         all_reasons = []
         scores = {}
-        
+
         # 1. Trend filter (most important)
-        trend_passed, direction, trend_reasons = self.check_trend(data)
+        trend_passed, direction, trend_reasons = self.check_trend(data, trend_direction)
         all_reasons.extend(trend_reasons)
         scores['trend'] = 1 if trend_passed else 0
         
@@ -265,7 +310,7 @@ class EdgeFilters:
             )
         
         # 3. Event filter
-        event_passed, event_reasons = self.check_events(data)
+        event_passed, event_reasons = self.check_events(data, now=now)
         all_reasons.extend(event_reasons)
         scores['events'] = 1 if event_passed else 0
         
@@ -300,15 +345,39 @@ def scan_for_edges(market_data: dict) -> list[FilterResult]:
     Scan all tickers and return those that pass all filters.
     """
     filters = EdgeFilters()
-    results = []
-    
-    for ticker, data in market_data.items():
-        result = filters.apply_all_filters(ticker, data)
-        results.append(result)
-    
-    # Sort by total score, then by passed status
-    results.sort(key=lambda x: (x.passed, x.scores.get('total', 0)), reverse=True)
+
+    # Vectorized trend pre-screen: classify the whole universe in one pass,
+    # then the per-ticker loop only formats reasons and runs the remaining
+    # filters for tickers that actually have a direction
+    directions = filters.check_trend_batch(market_data)
+
+    # One clock read for the whole scan instead of one per ticker
+    now = datetime.now()
+
+    def _process_ticker(item):
+        ticker, data = item
+        return filters.apply_all_filters(ticker, data,
+                                         trend_direction=directions.get(ticker),
+                                         now=now)
+
+    # Per-ticker filtering is independent - fan out for larger universes.
+    # Threads (not processes) so the options DataFrames in each ticker's
+    # data aren't pickled per call; small scans skip the pool overhead.
+    items = list(market_data.items())
+    if len(items) > 32:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(_process_ticker, items))
+    else:
+        results = [_process_ticker(item) for item in items]
     
+    # Sort by (passed, total score) - C-level lexsort over parallel arrays
+    # instead of Python tuple compares per element
+    if len(results) > 1:
+        totals = np.fromiter((r.scores.get('total', 0) for r in results),
+                             dtype=np.float64, count=len(results))
+        passed = np.fromiter((r.passed for r in results), dtype=bool, count=len(results))
+        results = [results[i] for i in np.lexsort((totals, passed))[::-1]]
+
     return results
 
 
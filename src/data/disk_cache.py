@@ -0,0 +1,82 @@
+"""
+Disk Cache
+Pickle-on-disk cache keyed by (feed, key) with TTLs from REFRESH_INTERVALS.
+Lets repeat scans (e.g. debug_strategy iterating strategies over the same
+tickers) skip the network entirely while a feed is inside its TTL window.
+"""
+import os
+import pickle
+import time
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+try:
+    from config import REFRESH_INTERVALS
+except ImportError:
+    # Safe defaults if run outside the project root
+    REFRESH_INTERVALS = {
+        "prices": 60,
+        "options_chain": 300,
+        "news": 600,
+        "fundamentals": 86400,
+    }
+
+
+# Price/chain data only moves while the market trades - off-hours, cached
+# entries for these feeds stay valid far longer than their intraday TTL
+_MARKET_CADENCE_FEEDS = {"prices", "options_chain"}
+_OFF_HOURS_TTL = 86400
+_EASTERN = ZoneInfo("America/New_York")
+
+
+def _market_likely_open() -> bool:
+    """US-session check in exchange time (weekday, 9:30-16:00 Eastern).
+    Deployments run on UTC clocks, so this must not use local time - a
+    wrong answer here would serve day-old prices in the middle of a live
+    session. Holidays still count as open; they just keep the shorter
+    intraday TTL, which is the safe direction."""
+    now = datetime.now(_EASTERN)
+    minutes = now.hour * 60 + now.minute
+    return now.weekday() < 5 and 9 * 60 + 30 <= minutes <= 16 * 60
+
+
+class DiskCache:
+    """File-per-entry cache with mtime-based expiry (TTLs aligned to data
+    cadence: intraday while the market trades, daily off-hours)."""
+
+    def __init__(self, cache_dir: str = None, ttls: dict = None):
+        self.cache_dir = cache_dir or os.path.join(
+            os.path.dirname(__file__), '..', '..', '.cache'
+        )
+        self.ttls = ttls or REFRESH_INTERVALS
+
+    def _path(self, feed: str, key: str) -> str:
+        return os.path.join(self.cache_dir, feed, f"{key}.pkl")
+
+    def get(self, feed: str, key: str):
+        """Return the cached value, or None if missing or expired."""
+        path = self._path(feed, key)
+        try:
+            ttl = self.ttls.get(feed, 0)
+            if feed in _MARKET_CADENCE_FEEDS and not _market_likely_open():
+                ttl = max(ttl, _OFF_HOURS_TTL)
+            if os.path.exists(path) and time.time() - os.path.getmtime(path) < ttl:
+                with open(path, 'rb') as f:
+                    return pickle.load(f)
+        except Exception as e:
+            print(f"Disk cache read error ({feed}/{key}): {e}")
+        return None
+
+    def set(self, feed: str, key: str, value):
+        """Store a value; failures are non-fatal (cache is best-effort)."""
+        path = self._path(feed, key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f:
+                pickle.dump(value, f)
+        except Exception as e:
+            print(f"Disk cache write error ({feed}/{key}): {e}")
+
+
+# Shared across fetchers in the process - all entries live under .cache/
+DISK_CACHE = DiskCache()
@@ -2,20 +2,213 @@
 Options Flow & Whale Activity Scraper
 Aggregates unusual options activity by ticker to show net sentiment.
 """
+import heapq
+import re
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import yfinance as yf
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+import numpy as np
 import pandas as pd
 
+# Several scraper methods hit the same symbols (AAPL shows up in unusual
+# flow, movers and earnings in one get_flow_data call). Share yf.Ticker
+# handles and history frames for a short TTL so concurrent workers don't
+# repeat the same HTTP round-trips.
+_TICKER_TTL = 60  # seconds
+_result_cache: dict = {}
+
+
+def _memoized(key: str, ttl: int, fetch, force_refresh: bool = False):
+    """TTL memoizer for whole scrape results (dict + timestamp, shared
+    across FlowScraper instances since one is built per get_flow_data)."""
+    now = time.monotonic()
+    if not force_refresh:
+        with _cache_lock:
+            entry = _result_cache.get(key)
+            if entry and now - entry[1] < ttl:
+                return entry[0]
+
+    value = fetch()
+    with _cache_lock:
+        _result_cache[key] = (value, now)
+    return value
+
+# Fear & Greed scrape patterns, compiled once at import
+# (the page shows the value prominently: score, then label)
+_FG_PATTERNS = [
+    re.compile(r'(\d{1,2})\s*(?:Neutral|Fear|Greed|Extreme Fear|Extreme Greed)', re.IGNORECASE),
+    re.compile(r'Now\s*(\d{1,2})'),
+]
+_FG_SCRIPT_PATTERN = re.compile(r'"(?:value|score|index)":\s*(\d{1,2})')
+
+# Bit -> flag string for _analyze_chain's scoring loop ('Weekly' is
+# chain-constant and appended separately)
+_FLAG_NAMES = (
+    (1, 'VOL>>OI'),
+    (2, 'High Vol/OI'),
+    (4, 'WHALE $5M+'),
+    (8, '$1M+'),
+    (16, 'OTM Bet'),
+)
+
+# Scan universes, built once at import instead of per call
+_UNUSUAL_TICKERS = (
+    'SPY', 'QQQ', 'AAPL', 'TSLA', 'NVDA', 'AMD', 'META', 'AMZN', 'GOOGL', 'MSFT',
+    'NFLX', 'BA', 'DIS', 'COIN', 'PLTR', 'SOFI', 'NIO', 'RIVN', 'GME', 'AMC',
+    'JPM', 'BAC', 'GS', 'XOM', 'CVX', 'PFE', 'MRNA', 'INTC', 'MU', 'SHOP',
+)
+_ACTIVE_TICKERS = ('SPY', 'QQQ', 'AAPL', 'TSLA', 'NVDA', 'AMD', 'META', 'AMZN')
+_MOVER_TICKERS = (
+    'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'META', 'NVDA', 'TSLA', 'AMD',
+    'NFLX', 'CRM', 'JPM', 'BAC', 'GS', 'V', 'MA', 'XOM', 'CVX',
+)
+_EARNINGS_TICKERS = (
+    'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'META', 'NVDA', 'TSLA', 'AMD',
+    'NFLX', 'CRM', 'JPM', 'BAC', 'GS', 'V', 'MA', 'XOM', 'CVX',
+    'JNJ', 'UNH', 'PFE', 'WMT', 'HD', 'MCD', 'NKE', 'SBUX',
+    'KO', 'PEP', 'COST', 'DIS', 'PYPL', 'INTC', 'QCOM', 'AVGO',
+    'ADBE', 'NOW', 'SNOW', 'NET', 'DDOG', 'ZS', 'CRWD', 'PANW',
+)
+_SECTOR_ETFS = (
+    ('XLK', 'Technology'),
+    ('XLF', 'Financials'),
+    ('XLE', 'Energy'),
+    ('XLV', 'Healthcare'),
+    ('XLI', 'Industrials'),
+    ('XLY', 'Consumer Disc'),
+    ('XLP', 'Consumer Staples'),
+    ('XLU', 'Utilities'),
+    ('XLRE', 'Real Estate'),
+    ('XLB', 'Materials'),
+)
+_INDEX_MAP = {
+    'spy': ('SPY', 'S&P 500'),
+    'dow': ('^DJI', 'DOW'),
+    'nasdaq': ('^IXIC', 'NASDAQ'),
+    'vix': ('^VIX', 'VIX'),
+}
+
+_ticker_cache: dict = {}
+_info_cache: dict = {}
+_history_cache: dict = {}
+_cache_lock = threading.Lock()
+
+
+def _get_ticker(symbol: str) -> yf.Ticker:
+    """TTL-cached yf.Ticker handle. The object memoizes .info/.options
+    internally, so sharing it dedupes those fetches across methods."""
+    now = time.monotonic()
+    with _cache_lock:
+        entry = _ticker_cache.get(symbol)
+        if entry and now - entry[1] < _TICKER_TTL:
+            return entry[0]
+
+    stock = yf.Ticker(symbol)
+    with _cache_lock:
+        _ticker_cache[symbol] = (stock, now)
+    return stock
+
+
+def _get_info(symbol: str) -> dict:
+    """TTL-cached stock.info (a separate HTTP call per symbol; several
+    methods want the same popular symbols within one refresh cycle)."""
+    now = time.monotonic()
+    with _cache_lock:
+        entry = _info_cache.get(symbol)
+        if entry and now - entry[1] < _TICKER_TTL:
+            return entry[0]
+
+    info = _get_ticker(symbol).info
+    with _cache_lock:
+        _info_cache[symbol] = (info, now)
+    return info
+
+
+def _get_history(symbol: str, period: str) -> pd.DataFrame:
+    """TTL-cached price history (movers/indices/sectors all want the same
+    2-day frames; fetch each (symbol, period) once per minute)."""
+    key = (symbol, period)
+    now = time.monotonic()
+    with _cache_lock:
+        entry = _history_cache.get(key)
+        if entry and now - entry[1] < _TICKER_TTL:
+            return entry[0]
+
+    hist = _get_ticker(symbol).history(period=period)
+    with _cache_lock:
+        _history_cache[key] = (hist, now)
+    return hist
+
+
+def _get_histories(symbols: list, period: str) -> dict:
+    """
+    Batched TTL-cached history: one yf.download covers every cache miss
+    (yfinance packs ~20 symbols per request) instead of a round-trip per
+    symbol. Returns {symbol: DataFrame} for whatever resolved.
+    """
+    now = time.monotonic()
+    result = {}
+    missing = []
+    with _cache_lock:
+        for sym in symbols:
+            entry = _history_cache.get((sym, period))
+            if entry and now - entry[1] < _TICKER_TTL:
+                result[sym] = entry[0]
+            else:
+                missing.append(sym)
+
+    if not missing:
+        return result
+
+    try:
+        data = yf.download(' '.join(missing), period=period,
+                           group_by='ticker', threads=True, progress=False)
+    except Exception as e:
+        print(f"Batched history download failed: {e}")
+        return result
+
+    if data is None or data.empty:
+        return result
+
+    for sym in missing:
+        try:
+            hist = data[sym] if len(missing) > 1 else data
+            hist = hist.dropna(how='all')
+        except (KeyError, IndexError):
+            continue
+        with _cache_lock:
+            _history_cache[(sym, period)] = (hist, now)
+        result[sym] = hist
+
+    return result
+
 
 class FlowScraper:
     """Scrapes unusual options flow and aggregates by ticker."""
     
     def __init__(self):
         self.session = requests.Session()
+        # Concurrent workers share this session - size the connection pool
+        # so parallel scrapes reuse sockets instead of reopening them, and
+        # retry transient gateway errors with backoff to trim tail latency
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=[502, 503, 504]),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive',
         })
     
     def get_unusual_flow(self) -> list[dict]:
@@ -25,134 +218,125 @@ class FlowScraper:
         """
         # First collect all unusual activity
         raw_flow = []
-        
-        tickers = [
-            'SPY', 'QQQ', 'AAPL', 'TSLA', 'NVDA', 'AMD', 'META', 'AMZN', 'GOOGL', 'MSFT',
-            'NFLX', 'BA', 'DIS', 'COIN', 'PLTR', 'SOFI', 'NIO', 'RIVN', 'GME', 'AMC',
-            'JPM', 'BAC', 'GS', 'XOM', 'CVX', 'PFE', 'MRNA', 'INTC', 'MU', 'SHOP'
-        ]
-        
-        for ticker in tickers:
-            unusual = self._find_unusual_for_ticker(ticker)
-            raw_flow.extend(unusual)
+
+        # Each ticker costs several HTTPS round-trips - fan out so wall time
+        # is the slowest ticker, not the sum of all of them
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            for unusual in executor.map(self._find_unusual_for_ticker, _UNUSUAL_TICKERS):
+                raw_flow.extend(unusual)
         
         # Now AGGREGATE by ticker
         aggregated = self._aggregate_by_ticker(raw_flow)
-        
-        # Sort by total premium (biggest money first)
-        aggregated.sort(key=lambda x: x.get('total_premium', 0), reverse=True)
-        
-        return aggregated[:20]  # Top 20 tickers with unusual activity
+
+        # Top 20 tickers by total premium (biggest money first) -
+        # top-k selection instead of sorting the whole list
+        return heapq.nlargest(20, aggregated, key=lambda x: x.get('total_premium', 0))
     
     def _aggregate_by_ticker(self, raw_flow: list[dict]) -> list[dict]:
         """
         Aggregate all unusual options for a ticker into one summary.
         Shows: total call premium, total put premium, net sentiment.
         """
-        ticker_data = {}
-        
-        for item in raw_flow:
+        if not raw_flow:
+            return []
+
+        # C-backed groupby instead of per-row dict increments: split the
+        # call/put columns up front so one agg pass covers everything, and
+        # sort=False skips the group-key sort (we rank by premium later)
+        df = pd.DataFrame(raw_flow)
+        call_mask = (df['type'] == 'CALL').to_numpy()
+        premium = df['premium'].to_numpy(dtype=np.float64)
+        volume = df['volume'].to_numpy(dtype=np.float64)
+        df['call_premium'] = np.where(call_mask, premium, 0.0)
+        df['put_premium'] = np.where(call_mask, 0.0, premium)
+        df['call_volume'] = np.where(call_mask, volume, 0.0)
+        df['put_volume'] = np.where(call_mask, 0.0, volume)
+        df['num_calls'] = call_mask.astype(np.int64)
+        df['num_puts'] = (~call_mask).astype(np.int64)
+
+        agg = df.groupby('ticker', sort=False).agg(
+            call_premium=('call_premium', 'sum'),
+            put_premium=('put_premium', 'sum'),
+            call_volume=('call_volume', 'sum'),
+            put_volume=('put_volume', 'sum'),
+            num_calls=('num_calls', 'sum'),
+            num_puts=('num_puts', 'sum'),
+            max_vol_oi=('vol_oi_ratio', 'max'),
+        )
+
+        total_premium = agg['call_premium'] + agg['put_premium']
+
+        # Calculate net sentiment, vectorized
+        # Positive = more bullish, Negative = more bearish
+        call_ratio = np.where(total_premium > 0,
+                              agg['call_premium'] / np.where(total_premium > 0, total_premium, 1),
+                              0.5)
+        put_ratio = np.where(total_premium > 0,
+                             agg['put_premium'] / np.where(total_premium > 0, total_premium, 1),
+                             0.5)
+
+        sentiment_conds = [call_ratio > 0.7, call_ratio > 0.55,
+                           put_ratio > 0.7, put_ratio > 0.55]
+        sentiment = np.select(sentiment_conds,
+                              ['very bullish', 'bullish', 'very bearish', 'bearish'],
+                              default='mixed')
+        sentiment_score = np.select(sentiment_conds, [2, 1, -2, -1], default=0)
+
+        # Flags and top strikes still need a small per-row pass. Keep a
+        # bounded 3-element min-heap per ticker instead of accumulating
+        # every contract and sorting later; cap flags at 4 as they arrive.
+        # (seq breaks premium ties so the heap never compares dicts.)
+        strikes_by_ticker = {}
+        flags_by_ticker = {}
+        for seq, item in enumerate(raw_flow):
             ticker = item['ticker']
-            
-            if ticker not in ticker_data:
-                ticker_data[ticker] = {
-                    'ticker': ticker,
-                    'call_premium': 0,
-                    'put_premium': 0,
-                    'call_volume': 0,
-                    'put_volume': 0,
-                    'num_unusual_calls': 0,
-                    'num_unusual_puts': 0,
-                    'top_strikes': [],
-                    'flags': set(),
-                    'max_vol_oi': 0,
-                }
-            
-            data = ticker_data[ticker]
+            heap = strikes_by_ticker.setdefault(ticker, [])
             premium = item.get('premium', 0)
-            volume = item.get('volume', 0)
-            
-            if item['type'] == 'CALL':
-                data['call_premium'] += premium
-                data['call_volume'] += volume
-                data['num_unusual_calls'] += 1
-            else:
-                data['put_premium'] += premium
-                data['put_volume'] += volume
-                data['num_unusual_puts'] += 1
-            
-            # Track flags
-            for flag in item.get('flags', []):
-                data['flags'].add(flag)
-            
-            # Track max vol/oi ratio
-            vol_oi = item.get('vol_oi_ratio', 0)
-            if vol_oi > data['max_vol_oi']:
-                data['max_vol_oi'] = vol_oi
-            
-            # Track top strikes
-            data['top_strikes'].append({
+            entry = (premium, seq, {
                 'type': item['type'],
                 'strike': item['strike'],
                 'expiry': item['expiry'],
                 'premium': premium,
             })
-        
+            if len(heap) < 3:
+                heapq.heappush(heap, entry)
+            elif premium > heap[0][0]:
+                heapq.heapreplace(heap, entry)
+
+            flags = flags_by_ticker.setdefault(ticker, set())
+            for flag in item.get('flags', []):
+                if len(flags) >= 4:  # Limit flags
+                    break
+                flags.add(flag)
+
         # Convert to final format
         result = []
-        for ticker, data in ticker_data.items():
-            total_premium = data['call_premium'] + data['put_premium']
-            
-            # Calculate net sentiment
-            # Positive = more bullish, Negative = more bearish
-            if total_premium > 0:
-                call_ratio = data['call_premium'] / total_premium
-                put_ratio = data['put_premium'] / total_premium
-            else:
-                call_ratio = 0.5
-                put_ratio = 0.5
-            
-            # Determine sentiment
-            if call_ratio > 0.7:
-                sentiment = 'very bullish'
-                sentiment_score = 2
-            elif call_ratio > 0.55:
-                sentiment = 'bullish'
-                sentiment_score = 1
-            elif put_ratio > 0.7:
-                sentiment = 'very bearish'
-                sentiment_score = -2
-            elif put_ratio > 0.55:
-                sentiment = 'bearish'
-                sentiment_score = -1
-            else:
-                sentiment = 'mixed'
-                sentiment_score = 0
-            
-            # Get top strike by premium
-            top_strikes = sorted(data['top_strikes'], key=lambda x: x['premium'], reverse=True)[:3]
-            
-            # Build summary flags
-            flags = list(data['flags'])[:4]  # Limit flags
-            
+        for i, ticker in enumerate(agg.index):
+            # Top strikes by premium (the heap already holds at most 3)
+            top_strikes = [entry[2] for entry in
+                           sorted(strikes_by_ticker.get(ticker, []), reverse=True)]
+
+            # Summary flags (capped during collection)
+            flags = list(flags_by_ticker.get(ticker, set()))
+
             result.append({
                 'ticker': ticker,
-                'total_premium': total_premium,
-                'call_premium': data['call_premium'],
-                'put_premium': data['put_premium'],
-                'call_volume': data['call_volume'],
-                'put_volume': data['put_volume'],
-                'num_calls': data['num_unusual_calls'],
-                'num_puts': data['num_unusual_puts'],
-                'sentiment': sentiment,
-                'sentiment_score': sentiment_score,
-                'call_ratio': round(call_ratio * 100),
-                'put_ratio': round(put_ratio * 100),
-                'max_vol_oi': round(data['max_vol_oi'], 1),
+                'total_premium': float(total_premium.iloc[i]),
+                'call_premium': float(agg['call_premium'].iloc[i]),
+                'put_premium': float(agg['put_premium'].iloc[i]),
+                'call_volume': int(agg['call_volume'].iloc[i]),
+                'put_volume': int(agg['put_volume'].iloc[i]),
+                'num_calls': int(agg['num_calls'].iloc[i]),
+                'num_puts': int(agg['num_puts'].iloc[i]),
+                'sentiment': str(sentiment[i]),
+                'sentiment_score': int(sentiment_score[i]),
+                'call_ratio': round(float(call_ratio[i]) * 100),
+                'put_ratio': round(float(put_ratio[i]) * 100),
+                'max_vol_oi': round(float(agg['max_vol_oi'].iloc[i]), 1),
                 'top_strikes': top_strikes,
                 'flags': flags,
             })
-        
+
         return result
     
     def _find_unusual_for_ticker(self, ticker: str) -> list[dict]:
@@ -160,34 +344,43 @@ class FlowScraper:
         unusual = []
         
         try:
-            stock = yf.Ticker(ticker)
+            stock = _get_ticker(ticker)
             expirations = stock.options
             if not expirations:
                 return unusual
             
-            info = stock.info
+            info = _get_info(ticker)
             current_price = info.get('currentPrice') or info.get('regularMarketPrice', 100)
             
-            # Check first 3 expirations
-            for exp in expirations[:3]:
+            # Check first 3 expirations - each chain is its own HTTP
+            # round-trip, so fetch them concurrently and keep the old
+            # silent-continue semantics on per-expiry failures
+            def fetch(exp):
                 try:
-                    chain = stock.option_chain(exp)
-                    
-                    # Analyze calls
-                    if not chain.calls.empty:
-                        unusual.extend(self._analyze_chain(
-                            chain.calls, ticker, 'CALL', exp, current_price
-                        ))
-                    
-                    # Analyze puts
-                    if not chain.puts.empty:
-                        unusual.extend(self._analyze_chain(
-                            chain.puts, ticker, 'PUT', exp, current_price
-                        ))
-                        
+                    return exp, stock.option_chain(exp)
                 except Exception:
+                    return exp, None
+
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                chains = list(executor.map(fetch, expirations[:3]))
+
+            for exp, chain in chains:
+                if chain is None:
                     continue
-                    
+
+                # Analyze calls
+                if not chain.calls.empty:
+                    unusual.extend(self._analyze_chain(
+                        chain.calls, ticker, 'CALL', exp, current_price
+                    ))
+
+                # Analyze puts
+                if not chain.puts.empty:
+                    unusual.extend(self._analyze_chain(
+                        chain.puts, ticker, 'PUT', exp, current_price
+                    ))
+
+
         except Exception:
             pass
         
@@ -197,167 +390,168 @@ class FlowScraper:
                        expiry: str, current_price: float) -> list[dict]:
         """Analyze options chain for unusual activity."""
         unusual = []
-        
-        for _, row in df.iterrows():
-            try:
-                volume = row.get('volume', 0)
-                oi = row.get('openInterest', 1)
-                last_price = row.get('lastPrice', 0)
-                strike = row.get('strike', 0)
-                
-                if pd.isna(volume) or volume < 1000:
-                    continue
-                if pd.isna(oi):
-                    oi = 1
-                
-                vol_oi_ratio = volume / max(oi, 1)
-                premium = volume * last_price * 100
-                
-                # Calculate moneyness
-                if opt_type == 'CALL':
-                    moneyness = (strike - current_price) / current_price * 100
-                else:
-                    moneyness = (current_price - strike) / current_price * 100
-                
-                # UNUSUAL SCORE
-                unusual_score = 0
-                flags = []
-                
-                if vol_oi_ratio > 5:
-                    unusual_score += 40
-                    flags.append('VOL>>OI')
-                elif vol_oi_ratio > 3:
-                    unusual_score += 25
-                    flags.append('High Vol/OI')
-                elif vol_oi_ratio > 2:
-                    unusual_score += 10
-                
-                if premium > 5000000:
-                    unusual_score += 35
-                    flags.append('WHALE $5M+')
-                elif premium > 1000000:
-                    unusual_score += 25
-                    flags.append('$1M+')
-                elif premium > 500000:
-                    unusual_score += 15
-                
-                if moneyness > 5:
-                    unusual_score += 15
-                    flags.append('OTM Bet')
-                
-                exp_date = datetime.strptime(expiry, '%Y-%m-%d')
-                dte = (exp_date - datetime.now()).days
+        if df.empty:
+            return unusual
+
+        # Pull the columns once as arrays and do the cheap math vectorized -
+        # iterrows boxed every row into a Series just to reject most of them
+        vol = df['volume'].fillna(0).to_numpy(dtype=np.float64)
+        oi = df['openInterest'].fillna(1).to_numpy(dtype=np.float64)
+        last_price = df['lastPrice'].fillna(0).to_numpy(dtype=np.float64)
+        strike = df['strike'].to_numpy(dtype=np.float64)
+
+        premium = vol * last_price * 100
+        vol_oi = vol / np.maximum(oi, 1)
+
+        # Calculate moneyness
+        if opt_type == 'CALL':
+            moneyness = (strike - current_price) / current_price * 100
+        else:
+            moneyness = (current_price - strike) / current_price * 100
+
+        # Expiry is constant per chain - parse it once, not per row
+        exp_date = datetime.strptime(expiry, '%Y-%m-%d')
+        dte = (exp_date - datetime.now()).days
+
+        # Only rows past the volume/premium cutoffs get Python-level scoring
+        candidates = np.nonzero((vol >= 1000) & (premium > 100000))[0]
+
+        # The weekly bonus is constant per chain, not per row
+        base_score = 10 if dte <= 7 else 0
+
+        for i in candidates:
+            vol_oi_ratio = vol_oi[i]
+
+            # UNUSUAL SCORE - track which flags fired as bits and only
+            # build the string list for rows that survive the final cut,
+            # so the common reject path allocates nothing
+            unusual_score = base_score
+            fired = 0
+
+            if vol_oi_ratio > 5:
+                unusual_score += 40
+                fired |= 1  # VOL>>OI
+            elif vol_oi_ratio > 3:
+                unusual_score += 25
+                fired |= 2  # High Vol/OI
+            elif vol_oi_ratio > 2:
+                unusual_score += 10
+
+            if premium[i] > 5000000:
+                unusual_score += 35
+                fired |= 4  # WHALE $5M+
+            elif premium[i] > 1000000:
+                unusual_score += 25
+                fired |= 8  # $1M+
+            elif premium[i] > 500000:
+                unusual_score += 15
+
+            if moneyness[i] > 5:
+                unusual_score += 15
+                fired |= 16  # OTM Bet
+
+            # Only include if truly unusual
+            if unusual_score >= 25:
+                flags = [name for bit, name in _FLAG_NAMES if fired & bit]
                 if dte <= 7:
-                    unusual_score += 10
                     flags.append('Weekly')
-                
-                # Only include if truly unusual
-                if unusual_score >= 25 and premium > 100000:
-                    unusual.append({
-                        'ticker': ticker,
-                        'type': opt_type,
-                        'strike': f"${strike:.0f}",
-                        'expiry': expiry,
-                        'dte': dte,
-                        'volume': int(volume),
-                        'open_interest': int(oi),
-                        'vol_oi_ratio': round(vol_oi_ratio, 1),
-                        'premium': premium,
-                        'unusual_score': unusual_score,
-                        'flags': flags,
-                        'moneyness': round(moneyness, 1),
-                    })
-                    
-            except Exception:
-                continue
-        
+                unusual.append({
+                    'ticker': ticker,
+                    'type': opt_type,
+                    'strike': f"${strike[i]:.0f}",
+                    'expiry': expiry,
+                    'dte': dte,
+                    'volume': int(vol[i]),
+                    'open_interest': int(oi[i]),
+                    'vol_oi_ratio': round(vol_oi_ratio, 1),
+                    'premium': premium[i],
+                    'unusual_score': unusual_score,
+                    'flags': flags,
+                    'moneyness': round(moneyness[i], 1),
+                })
+
         return unusual
     
     def get_most_active_options(self) -> list[dict]:
         """Get most active options by volume."""
-        active = []
-        tickers = ['SPY', 'QQQ', 'AAPL', 'TSLA', 'NVDA', 'AMD', 'META', 'AMZN']
-        
-        for ticker in tickers:
+        def fetch(ticker):
             try:
-                stock = yf.Ticker(ticker)
+                stock = _get_ticker(ticker)
                 expirations = stock.options
                 if not expirations:
-                    continue
-                
+                    return None
+
                 total_volume = 0
                 for exp in expirations[:2]:
                     try:
                         chain = stock.option_chain(exp)
-                        call_vol = chain.calls['volume'].sum()
-                        put_vol = chain.puts['volume'].sum()
-                        if not pd.isna(call_vol):
-                            total_volume += call_vol
-                        if not pd.isna(put_vol):
-                            total_volume += put_vol
+                        # Series.sum(skipna=True, min_count=0) already
+                        # yields 0 for empty/all-NaN columns, so the old
+                        # per-scalar pd.isna guards were vestigial
+                        total_volume += pd.concat(
+                            [chain.calls['volume'], chain.puts['volume']]
+                        ).sum()
                     except:
                         pass
-                
-                active.append({
+
+                return {
                     'ticker': ticker,
-                    'volume': int(total_volume) if not pd.isna(total_volume) else 0,
-                })
+                    'volume': int(total_volume),
+                }
             except:
-                continue
-        
+                return None
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            active = [a for a in executor.map(fetch, _ACTIVE_TICKERS) if a]
+
         active.sort(key=lambda x: x['volume'], reverse=True)
         return active[:8]
     
     def get_market_movers(self) -> dict:
         """Get top gainers and losers."""
-        gainers = []
-        losers = []
-        
-        tickers = [
-            'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'META', 'NVDA', 'TSLA', 'AMD',
-            'NFLX', 'CRM', 'JPM', 'BAC', 'GS', 'V', 'MA', 'XOM', 'CVX'
-        ]
-        
-        for ticker in tickers:
+        # One batched download covers the whole list
+        histories = _get_histories(list(_MOVER_TICKERS), '2d')
+
+        items = []
+        for ticker in _MOVER_TICKERS:
             try:
-                stock = yf.Ticker(ticker)
-                hist = stock.history(period='2d')
-                
-                if len(hist) < 2:
+                hist = histories.get(ticker)
+                if hist is None or len(hist) < 2:
                     continue
-                
+
                 prev_close = hist['Close'].iloc[-2]
                 current = hist['Close'].iloc[-1]
                 change_pct = ((current - prev_close) / prev_close) * 100
-                
-                item = {
+
+                items.append({
                     'ticker': ticker,
                     'price': current,
                     'change_pct': change_pct,
-                }
-                
-                if change_pct > 0:
-                    gainers.append(item)
-                else:
-                    losers.append(item)
-                    
+                })
             except:
                 continue
-        
-        gainers.sort(key=lambda x: x['change_pct'], reverse=True)
-        losers.sort(key=lambda x: x['change_pct'])
-        
+
+        gainers = [i for i in items if i['change_pct'] > 0]
+        losers = [i for i in items if i['change_pct'] <= 0]
+
         return {
-            'gainers': gainers[:5],
-            'losers': losers[:5],
+            'gainers': heapq.nlargest(5, gainers, key=lambda x: x['change_pct']),
+            'losers': heapq.nsmallest(5, losers, key=lambda x: x['change_pct']),
         }
     
-    def get_fear_greed_index(self) -> dict:
+    def get_fear_greed_index(self, force_refresh: bool = False) -> dict:
+        """
+        Get the Fear & Greed Index (cached 30 min - it updates daily;
+        pass force_refresh=True to bypass).
+        """
+        return _memoized('fear_greed', 1800, self._fetch_fear_greed_index, force_refresh)
+
+    def _fetch_fear_greed_index(self) -> dict:
         """
         Get the Fear & Greed Index by scraping from feargreedmeter.com
         Falls back to CNN or calculated values if scraping fails.
         """
-        
+
         # Try to scrape from feargreedmeter.com first
         try:
             result = self._scrape_fear_greed_meter()
@@ -379,44 +573,33 @@ class FlowScraper:
     
     def _scrape_fear_greed_meter(self) -> dict:
         """Scrape Fear & Greed Index from feargreedmeter.com"""
-        import re
-        
         url = 'https://feargreedmeter.com/'
         response = self.session.get(url, timeout=10)
-        
-        if response.status_code != 200:
-            return None
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # The site shows the value prominently - look for it
-        # Try to find the main score value
-        text = soup.get_text()
-        
-        # Look for patterns like "47" followed by "Neutral" or similar
-        # The page structure shows: value, then label
-        patterns = [
-            r'(\d{1,2})\s*(?:Neutral|Fear|Greed|Extreme Fear|Extreme Greed)',
-            r'Now\s*(\d{1,2})',
-        ]
-        
+        response.raise_for_status()
+
+        # The site shows the value prominently - the numeric patterns don't
+        # need a DOM, so search the raw payload directly
+        text = response.text
         value = None
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _FG_PATTERNS:
+            match = pattern.search(text)
             if match:
                 value = int(match.group(1))
                 break
-        
-        # Also try to find in script tags (often JSON data)
-        scripts = soup.find_all('script')
-        for script in scripts:
-            if script.string:
-                # Look for fear greed value in JSON
-                match = re.search(r'"(?:value|score|index)":\s*(\d{1,2})', script.string)
-                if match:
-                    value = int(match.group(1))
-                    break
-        
+
+        if value is None:
+            # Fall back to the script tags (often JSON data) only when the
+            # raw regexes miss - parse just the <script> nodes with the
+            # C-backed lxml parser instead of building the full DOM
+            soup = BeautifulSoup(text, 'lxml', parse_only=SoupStrainer('script'))
+            for script in soup.find_all('script'):
+                if script.string:
+                    # Look for fear greed value in JSON
+                    match = _FG_SCRIPT_PATTERN.search(script.string)
+                    if match:
+                        value = int(match.group(1))
+                        break
+
         if value is None:
             return None
         
@@ -434,8 +617,7 @@ class FlowScraper:
         
         # Get VIX for additional info
         try:
-            vix = yf.Ticker('^VIX')
-            vix_hist = vix.history(period='1d')
+            vix_hist = _get_history('^VIX', '1d')
             vix_value = round(vix_hist['Close'].iloc[-1], 2) if not vix_hist.empty else None
         except:
             vix_value = None
@@ -449,8 +631,6 @@ class FlowScraper:
     
     def _scrape_cnn_fear_greed(self) -> dict:
         """Scrape Fear & Greed Index from CNN"""
-        import re
-        
         url = 'https://production.dataviz.cnn.io/index/fearandgreed/graphdata'
         
         try:
@@ -488,11 +668,8 @@ class FlowScraper:
         """Calculate a simple Fear & Greed estimate as fallback"""
         try:
             # Simple calculation based on VIX and SPY momentum
-            vix = yf.Ticker('^VIX')
-            spy = yf.Ticker('SPY')
-            
-            vix_hist = vix.history(period='1mo')
-            spy_hist = spy.history(period='6mo')
+            vix_hist = _get_history('^VIX', '1mo')
+            spy_hist = _get_history('SPY', '6mo')
             
             scores = []
             
@@ -553,28 +730,27 @@ class FlowScraper:
             }
 
 
-    def get_market_indices(self) -> dict:
-        """Get major market index data."""
+    def get_market_indices(self, force_refresh: bool = False) -> dict:
+        """Get major market index data (cached 60s)."""
+        return _memoized('market_indices', 60, self._fetch_market_indices, force_refresh)
+
+    def _fetch_market_indices(self) -> dict:
+        """Fetch major market index data."""
         indices = {}
-        
-        index_map = {
-            'spy': ('SPY', 'S&P 500'),
-            'dow': ('^DJI', 'DOW'),
-            'nasdaq': ('^IXIC', 'NASDAQ'),
-            'vix': ('^VIX', 'VIX'),
-        }
-        
-        for key, (ticker, name) in index_map.items():
+
+        # One batched download covers all four indices
+        histories = _get_histories([ticker for ticker, _ in _INDEX_MAP.values()], '2d')
+
+        for key, (ticker, name) in _INDEX_MAP.items():
             try:
-                stock = yf.Ticker(ticker)
-                hist = stock.history(period='2d')
-                
-                if len(hist) >= 2:
+                hist = histories.get(ticker)
+
+                if hist is not None and len(hist) >= 2:
                     current = hist['Close'].iloc[-1]
                     prev = hist['Close'].iloc[-2]
                     change = current - prev
                     change_pct = (change / prev) * 100
-                    
+
                     indices[key] = {
                         'name': name,
                         'price': round(current, 2),
@@ -583,35 +759,28 @@ class FlowScraper:
                     }
             except:
                 pass
-        
+
         return indices
     
-    def get_sector_performance(self) -> list[dict]:
-        """Get sector ETF performance."""
-        sectors = [
-            ('XLK', 'Technology'),
-            ('XLF', 'Financials'),
-            ('XLE', 'Energy'),
-            ('XLV', 'Healthcare'),
-            ('XLI', 'Industrials'),
-            ('XLY', 'Consumer Disc'),
-            ('XLP', 'Consumer Staples'),
-            ('XLU', 'Utilities'),
-            ('XLRE', 'Real Estate'),
-            ('XLB', 'Materials'),
-        ]
-        
+    def get_sector_performance(self, force_refresh: bool = False) -> list[dict]:
+        """Get sector ETF performance (cached 2 min)."""
+        return _memoized('sector_performance', 120, self._fetch_sector_performance, force_refresh)
+
+    def _fetch_sector_performance(self) -> list[dict]:
+        """Fetch sector ETF performance."""
+        # One batched download covers all ten sector ETFs
+        histories = _get_histories([ticker for ticker, _ in _SECTOR_ETFS], '2d')
+
         results = []
-        for ticker, name in sectors:
+        for ticker, name in _SECTOR_ETFS:
             try:
-                stock = yf.Ticker(ticker)
-                hist = stock.history(period='2d')
-                
-                if len(hist) >= 2:
+                hist = histories.get(ticker)
+
+                if hist is not None and len(hist) >= 2:
                     current = hist['Close'].iloc[-1]
                     prev = hist['Close'].iloc[-2]
                     change_pct = ((current - prev) / prev) * 100
-                    
+
                     results.append({
                         'ticker': ticker,
                         'name': name,
@@ -619,12 +788,16 @@ class FlowScraper:
                     })
             except:
                 pass
-        
+
         results.sort(key=lambda x: x['change_pct'], reverse=True)
         return results
     
-    def get_upcoming_events(self) -> list[dict]:
-        """Get upcoming market events (static for now, could be scraped)."""
+    def get_upcoming_events(self, force_refresh: bool = False) -> list[dict]:
+        """Get upcoming market events (cached 1h - the list is static)."""
+        return _memoized('upcoming_events', 3600, self._fetch_upcoming_events, force_refresh)
+
+    def _fetch_upcoming_events(self) -> list[dict]:
+        """Fetch upcoming market events (static for now, could be scraped)."""
         from datetime import datetime, timedelta
         
         # Common recurring events
@@ -671,7 +844,6 @@ class FlowScraper:
         Get upcoming earnings calendar.
         Uses Yahoo Finance to get earnings dates for major tickers.
         """
-        earnings = []
         today = datetime.now()
         
         # Define date ranges based on filter
@@ -686,39 +858,35 @@ class FlowScraper:
             start_date = today
             end_date = today + timedelta(days=14)
         
-        # Major tickers to check for earnings
-        tickers = [
-            'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'META', 'NVDA', 'TSLA', 'AMD',
-            'NFLX', 'CRM', 'JPM', 'BAC', 'GS', 'V', 'MA', 'XOM', 'CVX',
-            'JNJ', 'UNH', 'PFE', 'WMT', 'HD', 'MCD', 'NKE', 'SBUX',
-            'KO', 'PEP', 'COST', 'DIS', 'PYPL', 'INTC', 'QCOM', 'AVGO',
-            'ADBE', 'NOW', 'SNOW', 'NET', 'DDOG', 'ZS', 'CRWD', 'PANW'
-        ]
-        
-        for ticker in tickers:
+        # One yf.Tickers container shares its session across every symbol;
+        # .calendar has no true batch endpoint in this yfinance line, so the
+        # attribute accesses still fan out over threads
+        tickers_obj = yf.Tickers(' '.join(_EARNINGS_TICKERS))
+
+        def fetch(item):
+            ticker, stock = item
             try:
-                stock = yf.Ticker(ticker)
                 calendar = stock.calendar
-                
+
                 if calendar is None or calendar.empty:
-                    continue
-                
+                    return None
+
                 # Get earnings date
                 earnings_date = None
                 if 'Earnings Date' in calendar.index:
                     earnings_date = calendar.loc['Earnings Date']
                     if isinstance(earnings_date, pd.Series):
                         earnings_date = earnings_date.iloc[0]
-                
+
                 if earnings_date is None:
-                    continue
-                
+                    return None
+
                 # Convert to datetime if needed
                 if hasattr(earnings_date, 'to_pydatetime'):
                     earnings_date = earnings_date.to_pydatetime()
                 elif isinstance(earnings_date, str):
                     earnings_date = datetime.strptime(earnings_date[:10], '%Y-%m-%d')
-                
+
                 # Check if in range
                 if start_date <= earnings_date <= end_date:
                     # Get EPS estimate
@@ -727,21 +895,25 @@ class FlowScraper:
                         eps_estimate = calendar.loc['Earnings Average']
                         if isinstance(eps_estimate, pd.Series):
                             eps_estimate = eps_estimate.iloc[0]
-                    
+
                     # Determine time (BMO = before market open, AMC = after market close)
                     # This is a simplification - actual time would need to be scraped
                     time = 'amc'  # Default to after close
-                    
-                    earnings.append({
+
+                    return {
                         'ticker': ticker,
                         'date': earnings_date.strftime('%Y-%m-%d'),
                         'time': time,
                         'estimate': f"{eps_estimate:.2f}" if eps_estimate else None,
-                    })
-                    
+                    }
+
             except Exception:
-                continue
-        
+                pass
+            return None
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            earnings = [e for e in executor.map(fetch, tickers_obj.tickers.items()) if e]
+
         # Sort by date
         earnings.sort(key=lambda x: x['date'])
         
@@ -751,14 +923,20 @@ class FlowScraper:
 def get_flow_data() -> dict:
     """Get all flow data in one call."""
     scraper = FlowScraper()
-    
-    return {
-        'unusual_flow': scraper.get_unusual_flow(),
-        'most_active': scraper.get_most_active_options(),
-        'movers': scraper.get_market_movers(),
-        'sentiment': scraper.get_fear_greed_index(),
-        'indices': scraper.get_market_indices(),
-        'sectors': scraper.get_sector_performance(),
-        'events': scraper.get_upcoming_events(),
-        'timestamp': datetime.now().isoformat(),
-    }
+
+    # The seven scrapes are independent network calls - run them
+    # concurrently so total latency is the slowest one, not the sum
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = {
+            'unusual_flow': executor.submit(scraper.get_unusual_flow),
+            'most_active': executor.submit(scraper.get_most_active_options),
+            'movers': executor.submit(scraper.get_market_movers),
+            'sentiment': executor.submit(scraper.get_fear_greed_index),
+            'indices': executor.submit(scraper.get_market_indices),
+            'sectors': executor.submit(scraper.get_sector_performance),
+            'events': executor.submit(scraper.get_upcoming_events),
+        }
+        data = {key: future.result() for key, future in futures.items()}
+
+    data['timestamp'] = datetime.now().isoformat()
+    return data
